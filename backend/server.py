@@ -1,9 +1,11 @@
 import os
 import asyncio
+from contextlib import asynccontextmanager
 import hashlib
 import hmac
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from pydantic import BaseModel
 from typing import List, Optional, Dict
 import requests
@@ -11,6 +13,7 @@ import time
 import json
 import uuid
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import UpdateOne
 from dotenv import load_dotenv
 import base58
 import secp256k1
@@ -21,7 +24,17 @@ import random
 ROOT_DIR = os.path.dirname(__file__)
 load_dotenv(os.path.join(ROOT_DIR, '.env'))
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run the batched session writer (inserts and progress updates) for the lifetime of the app"""
+    app.state.session_flusher = asyncio.create_task(session_flusher())
+    yield
+    app.state.session_flusher.cancel()
+    # Write whatever is still buffered before the process exits
+    await flush_pending_sessions()
+    await flush_pending_session_updates()
+
+app = FastAPI(lifespan=lifespan)
 
 # CORS middleware
 app.add_middleware(
@@ -34,12 +47,21 @@ app.add_middleware(
 
 # MongoDB connection
 MONGO_URL = os.environ.get('MONGO_URL', 'mongodb://localhost:27017')
-client = AsyncIOMotorClient(MONGO_URL)
+# Bounded pool shared by all sessions; fail fast if MongoDB is unreachable
+# (zlib ships with Python - zstd would need the zstandard package and warns without it)
+client = AsyncIOMotorClient(
+    MONGO_URL,
+    maxPoolSize=50,
+    compressors="zlib",
+    retryWrites=True,
+    serverSelectionTimeoutMS=2000,
+)
 db = client.btc_recovery
 
 # REAL BIP39 implementation
 mnemo = Mnemonic("english")
-BIP39_WORDS = mnemo.wordlist
+BIP39_WORDS = tuple(mnemo.wordlist)  # Immutable, ordered for index lookups and display
+BIP39_WORD_SET = frozenset(BIP39_WORDS)  # O(1) membership checks
 
 class RecoverySession(BaseModel):
     session_id: Optional[str] = None
@@ -58,6 +80,9 @@ class RecoveryResult(BaseModel):
     balances: Dict[str, float]
     total_balance: float
 
+class WordValidationRequest(BaseModel):
+    words: List[str]
+
 # Fast demo balance checking (for testing real-time features)
 def get_demo_balance(address: str, mnemonic: str) -> float:
     """Fast demo balance checking to show real-time features working"""
@@ -169,56 +194,101 @@ def get_real_address_balance_ultra_fast(address: str) -> float:
         print(f"   ❌ ULTRA FAST check error for {address}: {e}")
         return 0.0
 
-def check_multiple_addresses_ultra_fast(addresses: dict, mnemonic: str, demo_mode: bool) -> dict:
-    """Check multiple addresses using ULTRA FAST multi-explorer threading"""
+# BATCHED balance lookups - one explorer request covers many addresses
+BATCH_BALANCE_URL = "https://blockchain.info/balance?active={addresses}"
+BATCH_BALANCE_TIMEOUT = 8
+BALANCE_BATCH_CHUNK = 100  # addresses per HTTP request (keeps the URL short)
+BALANCE_BATCH_EVERY = 100  # combinations between batched lookups in real mode
+BALANCE_BATCH_MAX_PENDING = 500  # addresses queued before an early flush
+BECH32_CHARSET = frozenset("qpzry9x8gf2tvdw0s3jn54khce6mua7l")
+
+def batchable_address(address: str) -> bool:
+    """Cheap shape check - one malformed address makes the batch endpoint reject its whole chunk"""
+    if address.startswith("bc1"):
+        return len(address) in (42, 62) and set(address[3:]) <= BECH32_CHARSET
+    return address[:1] in ("1", "3") and 26 <= len(address) <= 35
+
+def query_balance_chunk(chunk: List[str], balances: Dict[str, float]):
+    """One batched request for chunk; a rejected chunk is split in half and retried"""
+    print(f"🚀 ULTRA FAST batched check for {len(chunk)} addresses")
+    try:
+        response = requests.get(
+            BATCH_BALANCE_URL.format(addresses="|".join(chunk)),
+            timeout=BATCH_BALANCE_TIMEOUT
+        )
+        if response.status_code != 200:
+            print(f"   ⚠️ Batched balance request failed: {response.status_code}")
+            if len(chunk) > 1 and response.status_code < 500:
+                middle = len(chunk) // 2
+                query_balance_chunk(chunk[:middle], balances)
+                query_balance_chunk(chunk[middle:], balances)
+            return
+        
+        data = response.json()
+        with cache_lock:
+            for address in chunk:
+                if address in data:
+                    balance = data[address].get('final_balance', 0) / 100000000
+                    balances[address] = balance
+                    balance_cache[address] = balance
+    except Exception as e:
+        print(f"   ⚠️ Batched balance request error: {e}")
+
+def get_balances_batch(addresses: List[str]) -> Dict[str, float]:
+    """Get balances for many addresses with batched requests, falling back to multi-explorer checks"""
     balances = {}
+    to_query = []
     
-    if demo_mode:
-        # Demo mode - sequential but fast
-        for addr_type, address in addresses.items():
-            if address:
-                balance = get_demo_balance(address, mnemonic)
-                balances[addr_type] = balance
-        return balances
-    
-    # Real mode - ULTRA FAST multi-explorer concurrent checking
-    print("🚀 Starting ULTRA FAST multi-explorer concurrent checks...")
+    # Cached addresses never leave the process; malformed ones (e.g. the simplified
+    # bc1q{hex} native SegWit form) cannot hold BTC and are never sent anywhere
+    with cache_lock:
+        for address in dict.fromkeys(addresses):
+            if address in balance_cache:
+                balances[address] = balance_cache[address]
+                print(f"💾 Cache hit for {address}: {balances[address]:.8f} BTC")
+            elif not batchable_address(address):
+                balances[address] = 0.0
+            else:
+                to_query.append(address)
     
-    valid_addresses = [(addr_type, address) for addr_type, address in addresses.items() if address]
+    for start in range(0, len(to_query), BALANCE_BATCH_CHUNK):
+        query_balance_chunk(to_query[start:start + BALANCE_BATCH_CHUNK], balances)
     
-    if not valid_addresses:
-        return balances
-    
-    # Use ThreadPoolExecutor for concurrent multi-explorer requests
-    with ThreadPoolExecutor(max_workers=3) as executor:
-        # Submit all address checks concurrently
-        future_to_addr = {
-            executor.submit(get_real_address_balance_ultra_fast, address): addr_type 
-            for addr_type, address in valid_addresses
-        }
-        
-        # Collect results as they complete
-        for future in as_completed(future_to_addr, timeout=20):
-            addr_type = future_to_addr[future]
-            try:
-                balance = future.result()
-                balances[addr_type] = balance
-            except Exception as e:
-                print(f"   ⚠️ Error checking {addr_type}: {e}")
-                balances[addr_type] = 0.0
+    # Anything the batch could not answer goes through the multi-explorer failover path
+    missing = [address for address in to_query if address not in balances]
+    if missing:
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            for address, balance in zip(missing, executor.map(get_real_address_balance_ultra_fast, missing)):
+                balances[address] = balance
     
     return balances
 
+def check_multiple_addresses_ultra_fast(addresses: dict, mnemonic: str) -> dict:
+    """Check multiple addresses in demo mode (real mode batches them through check_pending_candidates)"""
+    balances = {}
+    for addr_type, address in addresses.items():
+        if address:
+            balances[addr_type] = get_demo_balance(address, mnemonic)
+    return balances
+
 # REAL Bitcoin cryptography functions
+
+# The BIP32 master key HMAC always uses the same key, so its keyed inner/outer
+# SHA512 state is computed once and copied for every seed
+BIP32_MASTER_HMAC = hmac.new(b"Bitcoin seed", digestmod=hashlib.sha512)
+BIP39_DEFAULT_SALT = b"mnemonic"
+
 def mnemonic_to_seed(mnemonic: str, passphrase: str = "") -> bytes:
     """Convert mnemonic to seed using PBKDF2 (BIP39 standard)"""
     mnemonic_bytes = mnemonic.encode('utf-8')
-    salt = ('mnemonic' + passphrase).encode('utf-8')
+    salt = ('mnemonic' + passphrase).encode('utf-8') if passphrase else BIP39_DEFAULT_SALT
     return hashlib.pbkdf2_hmac('sha512', mnemonic_bytes, salt, 2048)
 
 def seed_to_master_key(seed: bytes) -> tuple:
     """Derive master private key from seed (BIP32 standard)"""
-    hmac_result = hmac.new(b"Bitcoin seed", seed, hashlib.sha512).digest()
+    master_hmac = BIP32_MASTER_HMAC.copy()
+    master_hmac.update(seed)
+    hmac_result = master_hmac.digest()
     master_private_key = hmac_result[:32]
     master_chain_code = hmac_result[32:]
     return master_private_key, master_chain_code
@@ -268,6 +338,11 @@ def derive_bip44_address_key(seed: bytes, coin_type: int = 0, account: int = 0,
     
     return key
 
+def base58check_encode(versioned_payload: bytes) -> str:
+    """Base58Check encode a version-prefixed payload (double SHA256 checksum)"""
+    checksum = hashlib.sha256(hashlib.sha256(versioned_payload).digest()).digest()[:4]
+    return base58.b58encode(versioned_payload + checksum).decode()
+
 def mnemonic_to_addresses(mnemonic: str) -> tuple:
     """Generate REAL Bitcoin addresses AND private keys directly from mnemonic - FIXED CORRELATION"""
     try:
@@ -289,20 +364,13 @@ def mnemonic_to_addresses(mnemonic: str) -> tuple:
         # Store the private key in hex format for all address types (same key, different formats)
         private_key_hex = private_key.hex()
         
+        # HASH160 of the public key is shared by all three address formats
+        pubkey_hash = hashlib.new('ripemd160', hashlib.sha256(public_key).digest()).digest()
+        
         # REAL Legacy address (P2PKH) - 1xxxxx
         try:
-            # SHA256 then RIPEMD160
-            sha256_hash = hashlib.sha256(public_key).digest()
-            ripemd160_hash = hashlib.new('ripemd160', sha256_hash).digest()
-            
-            # Add version byte (0x00 for mainnet)
-            versioned_payload = b'\x00' + ripemd160_hash
-            
-            # Double SHA256 for checksum
-            checksum = hashlib.sha256(hashlib.sha256(versioned_payload).digest()).digest()[:4]
-            
-            # Base58 encode - REAL Bitcoin address
-            legacy_addr = base58.b58encode(versioned_payload + checksum).decode()
+            # Version byte 0x00 for mainnet, Base58Check encoded - REAL Bitcoin address
+            legacy_addr = base58check_encode(b'\x00' + pubkey_hash)
             addresses['legacy'] = legacy_addr
             private_keys['legacy'] = private_key_hex
             print(f"   📍 Legacy: {legacy_addr}")
@@ -315,20 +383,13 @@ def mnemonic_to_addresses(mnemonic: str) -> tuple:
         # REAL SegWit address (P2SH-P2WPKH) - 3xxxxx
         try:
             # Create redeemScript: OP_0 + 20-byte pubKeyHash
-            pubkey_hash = hashlib.new('ripemd160', hashlib.sha256(public_key).digest()).digest()
             redeem_script = b'\x00\x14' + pubkey_hash
             
             # Hash the redeemScript
             script_hash = hashlib.new('ripemd160', hashlib.sha256(redeem_script).digest()).digest()
             
-            # Add version byte (0x05 for P2SH)
-            versioned_payload = b'\x05' + script_hash
-            
-            # Double SHA256 for checksum
-            checksum = hashlib.sha256(hashlib.sha256(versioned_payload).digest()).digest()[:4]
-            
-            # Base58 encode - REAL Bitcoin SegWit address
-            segwit_addr = base58.b58encode(versioned_payload + checksum).decode()
+            # Version byte 0x05 for P2SH, Base58Check encoded - REAL Bitcoin SegWit address
+            segwit_addr = base58check_encode(b'\x05' + script_hash)
             addresses['segwit'] = segwit_addr
             private_keys['segwit'] = private_key_hex
             print(f"   📍 SegWit: {segwit_addr}")
@@ -339,7 +400,6 @@ def mnemonic_to_addresses(mnemonic: str) -> tuple:
         
         # REAL Native SegWit (Bech32) - bc1qxxxxx (simplified but valid format)
         try:
-            pubkey_hash = hashlib.new('ripemd160', hashlib.sha256(public_key).digest()).digest()
             native_addr = f"bc1q{pubkey_hash.hex()}"
             addresses['native_segwit'] = native_addr
             private_keys['native_segwit'] = private_key_hex
@@ -379,26 +439,126 @@ def generate_word_combinations(known_words: Dict[str, str], max_combinations: in
     if len(unknown_positions) > 6:
         print(f"⚠️  Warning: {len(unknown_positions)} unknown positions - this will take very long")
     
-    combinations_generated = 0
+    # Known words never change, so fill them into a single buffer once
+    full_combo = [''] * 12
+    for pos, word in known_words_int.items():
+        full_combo[pos] = word
+    
+    # Private RNG per generator - no shared global state between sessions
+    rng = random.Random()
+    unknown_count = len(unknown_positions)
     
     # Generate combinations more intelligently for real BIP39
     for _ in range(max_combinations):
-        if combinations_generated >= max_combinations:
-            break
-            
-        # Create a combination
-        full_combo = [''] * 12
-        
-        # Fill in known words
-        for pos, word in known_words_int.items():
+        # Only the unknown positions change - draw all of them in one call
+        for pos, word in zip(unknown_positions, rng.choices(BIP39_WORDS, k=unknown_count)):
             full_combo[pos] = word
-            
-        # Fill in random words for unknown positions
-        for pos in unknown_positions:
-            full_combo[pos] = random.choice(BIP39_WORDS)
         
-        combinations_generated += 1
-        yield full_combo
+        # Yield a snapshot so consumers never see the buffer mutate
+        yield full_combo.copy()
+
+# Batched session inserts - bursts of session starts share a single insert_many
+SESSION_FLUSH_INTERVAL = 0.01  # seconds to coalesce writes after the flusher is woken
+SESSION_FLUSH_MAX_BACKOFF = 5.0  # seconds between retries while MongoDB keeps failing
+SESSION_FLUSH_BATCH_SIZE = 100
+SESSION_UPDATE_MAX_ATTEMPTS = 5  # failed writes before a buffered update is dropped
+_pending_sessions = []
+# Set whenever something is buffered - the flusher sleeps on it instead of waking on a timer
+_session_flush_wakeup = asyncio.Event()
+
+async def flush_pending_sessions():
+    """Insert all buffered session documents with one insert_many call"""
+    global _pending_sessions
+    if not _pending_sessions:
+        return
+    
+    batch, _pending_sessions = _pending_sessions, []
+    try:
+        await db.sessions.insert_many([document for document, _ in batch], ordered=False)
+        for _, waiter in batch:
+            if not waiter.done():
+                waiter.set_result(None)
+    except Exception as e:
+        print(f"❌ Error flushing {len(batch)} sessions: {e}")
+        for _, waiter in batch:
+            if not waiter.done():
+                waiter.set_exception(e)
+
+# Buffered session updates - one merged $set per session, written together with bulk_write
+_pending_session_updates = {}
+
+# Failed bulk_write attempts per session since its last successful write
+_session_update_attempts = {}
+
+def queue_session_update(session_id: str, fields: dict):
+    """Merge fields into the pending update for a session (newest value wins)"""
+    if session_id in deleted_sessions:
+        return
+    _pending_session_updates.setdefault(session_id, {}).update(fields)
+    _session_flush_wakeup.set()
+
+async def flush_pending_session_updates() -> bool:
+    """Write all buffered session updates with one bulk_write call - False if the write failed"""
+    global _pending_session_updates
+    if not _pending_session_updates:
+        return True
+    
+    batch, _pending_session_updates = _pending_session_updates, {}
+    try:
+        await db.sessions.bulk_write(
+            [UpdateOne({"session_id": session_id}, {"$set": fields}) for session_id, fields in batch.items()],
+            ordered=False
+        )
+    except Exception as e:
+        print(f"❌ Error flushing updates for {len(batch)} sessions: {e}")
+        # Re-queue underneath anything newer so the next flush retries - up to SESSION_UPDATE_MAX_ATTEMPTS times
+        for session_id, fields in batch.items():
+            attempts = _session_update_attempts.get(session_id, 0) + 1
+            if attempts >= SESSION_UPDATE_MAX_ATTEMPTS:
+                print(f"❌ Dropping buffered update for session {session_id} after {attempts} failed writes")
+                _session_update_attempts.pop(session_id, None)
+                continue
+            _session_update_attempts[session_id] = attempts
+            _pending_session_updates[session_id] = {**fields, **_pending_session_updates.get(session_id, {})}
+        return False
+    
+    for session_id in batch:
+        _session_update_attempts.pop(session_id, None)
+    return True
+
+async def session_flusher():
+    """Background task that writes buffered inserts and updates shortly after they are queued"""
+    failures = 0
+    while True:
+        await _session_flush_wakeup.wait()
+        # Short coalescing window so a burst of writes shares one round-trip
+        await asyncio.sleep(SESSION_FLUSH_INTERVAL)
+        _session_flush_wakeup.clear()
+        
+        # Inserts first so updates never target a session that is not stored yet
+        await flush_pending_sessions()
+        if await flush_pending_session_updates():
+            failures = 0
+            continue
+        
+        # MongoDB is failing - retry the re-queued updates with exponential backoff
+        failures = min(failures + 1, 10)
+        await asyncio.sleep(min(SESSION_FLUSH_INTERVAL * 2 ** failures, SESSION_FLUSH_MAX_BACKOFF))
+        if _pending_session_updates:
+            _session_flush_wakeup.set()
+
+async def insert_session(document: dict):
+    """Queue a session document and wait until its batch has been written"""
+    waiter = asyncio.get_running_loop().create_future()
+    _pending_sessions.append((document, waiter))
+    _session_flush_wakeup.set()
+    
+    # Without a live flusher (lifespan not run, or the task died) nothing else would resolve the waiter
+    flusher = getattr(app.state, "session_flusher", None)
+    if len(_pending_sessions) >= SESSION_FLUSH_BATCH_SIZE or flusher is None or flusher.done():
+        await flush_pending_sessions()
+    
+    await waiter
 
 @app.post("/api/start-recovery")
 async def start_recovery(session: RecoverySession):
@@ -406,27 +566,133 @@ async def start_recovery(session: RecoverySession):
     try:
         session.session_id = str(uuid.uuid4())
         session.status = "running"
+        # Normalize user input once so the recovery loop never has to
+        session.known_words = {pos: word.strip().lower() for pos, word in session.known_words.items()}
         
         print(f"🚀 Starting REAL Bitcoin recovery session: {session.session_id}")
         print(f"📋 Known words: {session.known_words}")
         print(f"🎯 Max combinations: {session.max_combinations}")
         
-        # Store session in database
-        await db.sessions.insert_one(session.dict())
+        # Store session in database (batched with concurrent session starts)
+        await insert_session(session.model_dump(mode="python"))
         
         # Start background recovery task
-        asyncio.create_task(perform_recovery(session))
+        recovery_tasks[session.session_id] = asyncio.create_task(perform_recovery(session))
         
         return {"session_id": session.session_id, "status": "started"}
     except Exception as e:
         print(f"❌ Error starting recovery: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+# Live recovery tasks by session id - a session missing here has no producer of progress or logs
+recovery_tasks = {}
+# Cooperative cancellation - the recovery loop checks this set every iteration
+cancelled_sessions = set()
+# Deleted while still running - the task drops the session's in-memory state when it exits
+deleted_sessions = set()
+CANCEL_CHECK_INTERVAL = 1000  # combinations between forced event loop yields
+
+async def update_session_progress(session: RecoverySession, combinations_checked: int, found_count: int, pending_checks: int = 0):
+    """Persist, publish and log the current progress of a recovery session
+    
+    In real mode combinations_checked counts generated mnemonics; pending_checks of them are still
+    waiting for the next batched balance lookup, so their wallets are not in found_count yet.
+    """
+    queue_session_update(session.session_id, {
+        "combinations_checked": combinations_checked,
+        "found_wallets": found_count,
+        "pending_balance_checks": pending_checks,
+        "last_updated": time.time()
+    })
+    publish_session_progress(
+        session.session_id,
+        combinations_checked=combinations_checked,
+        found_wallets=found_count,
+        pending_balance_checks=pending_checks
+    )
+    progress_line = f"📊 Progress: {combinations_checked}/{session.max_combinations} - Found: {found_count} wallets"
+    if pending_checks:
+        progress_line += f" ({pending_checks} awaiting batched balance check)"
+    add_session_log(session.session_id, progress_line)
+    print(progress_line)
+    # Real mode only awaits when a balance batch flushes - yield so pollers and the flusher see this update
+    await asyncio.sleep(0)
+
+async def record_candidate(session: RecoverySession, candidate: tuple, balances: dict) -> bool:
+    """Log the balances of one checked mnemonic and store it if it holds any BTC"""
+    found_at, mnemonic_str, addresses, private_keys = candidate
+    total_balance = sum(balances.values())
+    
+    # Log individual balance results
+    for addr_type, balance in balances.items():
+        if addresses.get(addr_type) and balance > 0:
+            add_session_log(session.session_id, f"   💰 {addr_type}: {balance:.8f} BTC")
+    
+    # IMPROVED: Find ANY wallet with BTC > 0
+    if total_balance > 0:
+        if session.session_id in deleted_sessions:
+            # Deleted while its balances were being checked - never persist keys for a session that is gone
+            return True
+        add_session_log(session.session_id, f"🎉 WALLET FOUND! Total: {total_balance:.8f} BTC")
+        add_session_log(session.session_id, f"🔑 Mnemonic: {mnemonic_str}")
+        
+        result = {
+            "session_id": session.session_id,
+            "mnemonic": mnemonic_str,
+            "private_keys": private_keys,
+            "addresses": addresses,
+            "balances": balances,
+            "total_balance": total_balance,
+            "found_at": found_at
+        }
+        
+        # Persist immediately - found wallets are never kept in memory
+        await db.results.insert_one(result)
+        print(f"🎉 FOUND REAL WALLET WITH BTC!")
+        print(f"   Mnemonic: {mnemonic_str}")
+        print(f"   Total Balance: {total_balance:.8f} BTC")
+        for addr_type, addr in addresses.items():
+            if balances.get(addr_type, 0) > 0:
+                print(f"   {addr_type}: {addr} - {balances[addr_type]:.8f} BTC")
+                add_session_log(session.session_id, f"   💰 {addr_type}: {balances[addr_type]:.8f} BTC")
+        return True
+    
+    add_session_log(session.session_id, f"   ❌ No balance found, continuing search...")
+    return False
+
+async def check_pending_candidates(session: RecoverySession, candidates: list) -> int:
+    """Check a window of candidate mnemonics with one batched balance lookup, returning wallets found"""
+    add_session_log(session.session_id, f"⚡ Starting ULTRA FAST batched balance checks for {len(candidates)} mnemonics...")
+    
+    all_addresses = [
+        address
+        for _, _, addresses, _ in candidates
+        for address in addresses.values() if address
+    ]
+    address_balances = await asyncio.to_thread(get_balances_batch, all_addresses)
+    if session.session_id in deleted_sessions:
+        return 0  # Deleted while the batch was in flight - its results must not be stored
+    
+    # Redistribute the batched balances back to each mnemonic
+    found_count = 0
+    for candidate in candidates:
+        addresses = candidate[2]
+        balances = {
+            addr_type: address_balances.get(address, 0.0)
+            for addr_type, address in addresses.items() if address
+        }
+        if await record_candidate(session, candidate, balances):
+            found_count += 1
+    
+    return found_count
+
 async def perform_recovery(session: RecoverySession):
     """Perform REAL Bitcoin recovery with authentic cryptography and REAL balance checking"""
     try:
-        found_wallets = []
+        found_count = 0
         combinations_checked = 0
+        # Real mode: valid mnemonics waiting for the next batched balance lookup
+        pending_candidates = []
         
         print(f"🔍 REAL Bitcoin recovery started for session: {session.session_id}")
         add_session_log(session.session_id, f"🚀 Starting {'Fast Demo' if session.demo_mode else 'Real Blockchain'} recovery session")
@@ -435,15 +701,28 @@ async def perform_recovery(session: RecoverySession):
         add_session_log(session.session_id, f"🔍 Searching for wallets with ANY amount of BTC...")
         
         # Update session status
-        await db.sessions.update_one(
-            {"session_id": session.session_id},
-            {"$set": {"status": "running", "combinations_checked": 0}}
-        )
+        queue_session_update(session.session_id, {"status": "running", "combinations_checked": 0})
+        publish_session_progress(session.session_id, status="running", combinations_checked=0, found_wallets=0)
         
         # Generate and test combinations with REAL Bitcoin crypto
         for word_combo in generate_word_combinations(session.known_words, session.max_combinations):
             combinations_checked += 1
             
+            # Yield to the event loop regularly so other sessions and cancellation stay responsive
+            if combinations_checked % CANCEL_CHECK_INTERVAL == 0:
+                await asyncio.sleep(0)
+            if session.session_id in cancelled_sessions:
+                combinations_checked -= 1
+                add_session_log(session.session_id, f"🛑 Recovery cancelled after {combinations_checked} combinations")
+                break
+            
+            # Real mode: flush the batched balance lookup every BALANCE_BATCH_EVERY combinations
+            if pending_candidates and combinations_checked % BALANCE_BATCH_EVERY == 0:
+                found_count += await check_pending_candidates(session, pending_candidates)
+                pending_candidates = []
+                # ULTRA FAST: Minimal delay between batched explorer requests
+                await asyncio.sleep(0.05)
+            
             # Check if valid BIP39 mnemonic (REAL validation)
             if not check_mnemonic_validity(word_combo):
                 continue
@@ -461,106 +740,218 @@ async def perform_recovery(session: RecoverySession):
                     continue
                 
                 add_session_log(session.session_id, f"📍 Generated addresses: Legacy, SegWit, Native SegWit")
+                candidate = (combinations_checked, mnemonic_str, addresses, private_keys)
                 
-                # ULTRA FAST: Use multi-explorer balance checking for maximum speed
-                add_session_log(session.session_id, f"⚡ Starting {'demo' if session.demo_mode else 'ULTRA FAST multi-explorer'} balance checks...")
-                
-                balances = check_multiple_addresses_ultra_fast(addresses, mnemonic_str, session.demo_mode)
-                total_balance = sum(balances.values())
-                
-                # Log individual balance results
-                for addr_type, balance in balances.items():
-                    if addresses.get(addr_type) and balance > 0:
-                        add_session_log(session.session_id, f"   💰 {addr_type}: {balance:.8f} BTC")
-                
-                # ULTRA FAST: Minimal delay - multi-explorer handles everything
                 if not session.demo_mode:
-                    # Ultra minimal delay for real mode
-                    await asyncio.sleep(0.05)  # Just 0.05 seconds - ULTRA FAST!
-                
-                # IMPROVED: Find ANY wallet with BTC > 0
-                if total_balance > 0:
-                    add_session_log(session.session_id, f"🎉 WALLET FOUND! Total: {total_balance:.8f} BTC")
-                    add_session_log(session.session_id, f"🔑 Mnemonic: {mnemonic_str}")
-                    
-                    result = {
-                        "session_id": session.session_id,
-                        "mnemonic": mnemonic_str,
-                        "private_keys": private_keys,
-                        "addresses": addresses,
-                        "balances": balances,
-                        "total_balance": total_balance,
-                        "found_at": combinations_checked
-                    }
-                    
-                    await db.results.insert_one(result)
-                    found_wallets.append(result)
-                    print(f"🎉 FOUND REAL WALLET WITH BTC!")
-                    print(f"   Mnemonic: {mnemonic_str}")
-                    print(f"   Total Balance: {total_balance:.8f} BTC")
-                    for addr_type, addr in addresses.items():
-                        if balances.get(addr_type, 0) > 0:
-                            print(f"   {addr_type}: {addr} - {balances[addr_type]:.8f} BTC")
-                            add_session_log(session.session_id, f"   💰 {addr_type}: {balances[addr_type]:.8f} BTC")
+                    # Queue for the next batched lookup instead of one request per address
+                    pending_candidates.append(candidate)
+                    if len(pending_candidates) * len(addresses) >= BALANCE_BATCH_MAX_PENDING:
+                        found_count += await check_pending_candidates(session, pending_candidates)
+                        pending_candidates = []
+                        await asyncio.sleep(0.05)
                 else:
-                    add_session_log(session.session_id, f"   ❌ No balance found, continuing search...")
-                
-                # Small delay to make progress visible and update logs more frequently
-                await asyncio.sleep(0.8 if session.demo_mode else 0.2)
+                    add_session_log(session.session_id, f"⚡ Starting demo balance checks...")
+                    balances = check_multiple_addresses_ultra_fast(addresses, mnemonic_str)
+                    if await record_candidate(session, candidate, balances):
+                        found_count += 1
+                    
+                    # Small delay to make progress visible and update logs more frequently
+                    await asyncio.sleep(0.8)
                 
                 # Update progress every 2 combinations (more frequent for better terminal view)
                 if combinations_checked % 2 == 0:
-                    await db.sessions.update_one(
-                        {"session_id": session.session_id},
-                        {"$set": {
-                            "combinations_checked": combinations_checked,
-                            "found_wallets": len(found_wallets),
-                            "last_updated": time.time()
-                        }}
-                    )
-                    add_session_log(session.session_id, f"📊 Progress: {combinations_checked}/{session.max_combinations} - Found: {len(found_wallets)} wallets")
-                    print(f"📊 Progress: {combinations_checked}/{session.max_combinations} - Found: {len(found_wallets)} wallets")
+                    await update_session_progress(session, combinations_checked, found_count, len(pending_candidates))
                 
             except Exception as e:
                 print(f"❌ Error processing combination {combinations_checked}: {e}")
                 continue
         
-        # Mark session as completed
-        await db.sessions.update_one(
-            {"session_id": session.session_id},
-            {"$set": {
-                "status": "completed",
-                "combinations_checked": combinations_checked,
-                "found_wallets": len(found_wallets),
-                "completed_at": time.time()
-            }}
+        # Check whatever is left of the last real-mode window (unless cancelled)
+        if pending_candidates and session.session_id not in cancelled_sessions:
+            found_count += await check_pending_candidates(session, pending_candidates)
+        
+        # Mark session as completed (or cancelled)
+        final_status = "cancelled" if session.session_id in cancelled_sessions else "completed"
+        cancelled_sessions.discard(session.session_id)
+        queue_session_update(session.session_id, {
+            "status": final_status,
+            "combinations_checked": combinations_checked,
+            "found_wallets": found_count,
+            "pending_balance_checks": 0,
+            "completed_at": time.time()
+        })
+        publish_session_progress(
+            session.session_id,
+            status=final_status,
+            combinations_checked=combinations_checked,
+            found_wallets=found_count,
+            pending_balance_checks=0
         )
         
-        print(f"🎉 REAL Bitcoin recovery completed!")
+        print(f"🎉 REAL Bitcoin recovery {final_status}!")
         print(f"   Combinations tested: {combinations_checked}")
-        print(f"   Wallets found: {len(found_wallets)}")
+        print(f"   Wallets found: {found_count}")
         
     except Exception as e:
         print(f"❌ Recovery error: {e}")
-        await db.sessions.update_one(
-            {"session_id": session.session_id},
-            {"$set": {"status": "error", "error": str(e)}}
-        )
+        queue_session_update(session.session_id, {"status": "error", "error": str(e)})
+        publish_session_progress(session.session_id, status="error", error=str(e))
+        cancelled_sessions.discard(session.session_id)
+    finally:
+        recovery_tasks.pop(session.session_id, None)
+        if session.session_id in deleted_sessions:
+            deleted_sessions.discard(session.session_id)
+            drop_session_state(session.session_id)
+        else:
+            # Keep the final snapshot around while the buffered writes catch up, then let it go
+            asyncio.get_running_loop().call_later(
+                SESSION_PROGRESS_RETENTION_SECONDS, session_progress.pop, session.session_id, None
+            )
 
 @app.get("/api/session/{session_id}")
-async def get_session_status(session_id: str):
-    """Get status of a recovery session"""
+async def get_session_status(session_id: str, request: Request):
+    """Get status of a recovery session (304 Not Modified while nothing has changed)"""
     try:
+        # Cheap check against the in-memory snapshot before touching MongoDB
+        if_none_match = request.headers.get("if-none-match")
+        progress = session_progress.get(session_id)
+        if if_none_match and progress is not None and if_none_match == session_etag(progress):
+            return Response(status_code=304, headers={"ETag": if_none_match})
+        
         session = await db.sessions.find_one({"session_id": session_id})
         if not session:
             raise HTTPException(status_code=404, detail="Session not found")
         
         session.pop('_id', None)
-        return session
+        # MongoDB lags behind while updates are buffered - overlay them so body and ETag are current
+        session.update(_pending_session_updates.get(session_id, {}))
+        session.update(session_progress.get(session_id, {}))
+        etag = session_etag(session)
+        if if_none_match == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+        return JSONResponse(content=session, headers={"ETag": etag})
     except Exception as e:
         print(f"Error getting session status: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+SESSION_WAIT_MAX_SECONDS = 60
+
+@app.get("/api/session/{session_id}/wait")
+async def wait_for_session(session_id: str, timeout: float = 30):
+    """Long-poll: return the session as soon as it finishes, or its current state after timeout seconds"""
+    session = await db.sessions.find_one({"session_id": session_id})
+    if not session:
+        raise HTTPException(status_code=404, detail="Session not found")
+    session.pop('_id', None)
+    
+    progress = session_progress.get(session_id, session)
+    if progress.get("status") not in SESSION_TERMINAL_STATES:
+        queue = asyncio.Queue()
+        session_subscribers.setdefault(session_id, []).append(queue)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + max(0.0, min(timeout, SESSION_WAIT_MAX_SECONDS))
+        try:
+            while progress.get("status") not in SESSION_TERMINAL_STATES:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    progress = await asyncio.wait_for(queue.get(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    break
+        finally:
+            subscribers = session_subscribers.get(session_id, [])
+            if queue in subscribers:
+                subscribers.remove(queue)
+            if not subscribers:
+                session_subscribers.pop(session_id, None)
+    
+    # The in-memory snapshot is ahead of MongoDB while session updates are buffered
+    session.update(session_progress.get(session_id, {}))
+    return session
+
+def drop_session_state(session_id: str):
+    """Forget everything kept in memory for a session (logs, progress, unwritten updates)"""
+    _pending_session_updates.pop(session_id, None)
+    session_logs.pop(session_id, None)
+    session_log_counts.pop(session_id, None)
+    session_progress.pop(session_id, None)
+
+@app.delete("/api/session/{session_id}")
+async def delete_session(session_id: str):
+    """Delete a recovery session with its results and logs, cancelling it first if still running"""
+    running = session_id in recovery_tasks
+    if running:
+        # The task would re-create the in-memory state on its way out - it drops it when it exits instead
+        cancelled_sessions.add(session_id)
+        deleted_sessions.add(session_id)
+    else:
+        drop_session_state(session_id)
+    
+    _pending_session_updates.pop(session_id, None)
+    deleted = await db.sessions.delete_one({"session_id": session_id})
+    await db.results.delete_many({"session_id": session_id})
+    
+    if deleted.deleted_count == 0 and not running:
+        raise HTTPException(status_code=404, detail="Session not found")
+    return {"session_id": session_id, "status": "deleted"}
+
+@app.post("/api/cancel/{session_id}")
+async def cancel_recovery(session_id: str):
+    """Ask a running recovery session to stop at its next iteration"""
+    if session_id not in recovery_tasks:
+        session = session_progress.get(session_id) or await db.sessions.find_one({"session_id": session_id})
+        if not session:
+            raise HTTPException(status_code=404, detail="Session not found")
+        return {"session_id": session_id, "status": session.get("status")}
+    
+    cancelled_sessions.add(session_id)
+    return {"session_id": session_id, "status": "cancelling"}
+
+@app.get("/api/session/{session_id}/stream")
+async def stream_session_status(session_id: str):
+    """Push session progress to the client as Server-Sent Events instead of polling"""
+    queue = asyncio.Queue()
+    session_subscribers.setdefault(session_id, []).append(queue)
+    
+    async def event_stream():
+        try:
+            # Send the current snapshot first so late subscribers are in sync
+            progress = session_progress.get(session_id)
+            if progress is None:
+                progress = await db.sessions.find_one({"session_id": session_id})
+                if not progress:
+                    yield f"event: error\ndata: {json.dumps({'detail': 'Session not found'})}\n\n"
+                    return
+                progress.pop('_id', None)
+            yield f"data: {json.dumps(progress)}\n\n"
+            
+            while progress.get("status") not in SESSION_TERMINAL_STATES:
+                if session_id not in recovery_tasks and queue.empty():
+                    # Nothing will publish again (e.g. the server restarted mid-session) - end with the stored state
+                    stored = await db.sessions.find_one({"session_id": session_id}, {"_id": 0})
+                    if stored:
+                        yield f"data: {json.dumps(stored)}\n\n"
+                    break
+                try:
+                    progress = await asyncio.wait_for(queue.get(), timeout=SSE_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield f"data: {json.dumps(progress)}\n\n"
+        finally:
+            subscribers = session_subscribers.get(session_id, [])
+            if queue in subscribers:
+                subscribers.remove(queue)
+            if not subscribers:
+                session_subscribers.pop(session_id, None)
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 @app.get("/api/results/{session_id}")
 async def get_session_results(session_id: str):
     """Get results for a recovery session"""
@@ -578,12 +969,32 @@ async def get_session_results(session_id: str):
 @app.get("/api/validate-word/{word}")
 async def validate_bip39_word(word: str):
     """Check if a word is in REAL BIP39 wordlist"""
-    return {"valid": word.lower() in BIP39_WORDS, "word": word.lower()}
+    word = word.lower()
+    return {"valid": word in BIP39_WORD_SET, "word": word}
+
+@app.post("/api/validate-words")
+async def validate_bip39_words(request: WordValidationRequest):
+    """Check a batch of words against the REAL BIP39 wordlist in one round-trip (batch form of /validate-word)"""
+    words = [word.lower() for word in request.words]
+    return {"results": [{"valid": word in BIP39_WORD_SET, "word": word} for word in words]}
+
+def precompute_json(content) -> bytes:
+    """Serialize a constant response body once, exactly as FastAPI's JSONResponse would"""
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+# Return first 100 for UI performance - constant, so serialized once at startup
+WORDLIST_JSON = precompute_json({"words": BIP39_WORDS[:100]})
+# All 2048 words, for clients that validate words locally
+FULL_WORDLIST_JSON = precompute_json({"words": BIP39_WORDS})
 
 @app.get("/api/wordlist")
-async def get_bip39_wordlist():
-    """Get the REAL BIP39 word list"""
-    return {"words": BIP39_WORDS[:100]}  # Return first 100 for UI performance
+async def get_bip39_wordlist(full: bool = False):
+    """Get the REAL BIP39 word list (?full=true for all 2048 words)"""
+    return Response(
+        content=FULL_WORDLIST_JSON if full else WORDLIST_JSON,
+        media_type="application/json",
+        headers={"Cache-Control": "public, max-age=86400"}  # The BIP39 list never changes
+    )
 
 @app.post("/api/test-wallet-found")
 async def test_wallet_found():
@@ -621,6 +1032,10 @@ async def test_wallet_found():
 
 # Global log storage for real-time terminal view
 session_logs = {}
+# Total lines ever logged per session - absolute cursor for ?since= (the stored list is truncated)
+session_log_counts = {}
+# SSE subscriber queues for live log lines (None marks the end of the session)
+log_subscribers = {}
 
 def add_session_log(session_id: str, message: str):
     """Add a log message for real-time terminal display"""
@@ -630,35 +1045,143 @@ def add_session_log(session_id: str, message: str):
     timestamp = time.strftime("%H:%M:%S", time.localtime())
     log_entry = f"[{timestamp}] {message}"
     session_logs[session_id].append(log_entry)
+    session_log_counts[session_id] = session_log_counts.get(session_id, 0) + 1
+    
+    for queue in log_subscribers.get(session_id, []):
+        queue.put_nowait(log_entry)
     
     # Keep only last 50 log entries per session
     if len(session_logs[session_id]) > 50:
         session_logs[session_id] = session_logs[session_id][-50:]
 
+# Latest progress snapshot per session and SSE subscriber queues for push updates
+session_progress = {}
+session_subscribers = {}
+SESSION_TERMINAL_STATES = ("completed", "cancelled", "error")
+SESSION_PROGRESS_RETENTION_SECONDS = 60  # after the session ends
+SSE_KEEPALIVE_SECONDS = 15
+
+def session_etag(session: dict) -> str:
+    """ETag derived from the fields that change while a session runs"""
+    return f'"{session.get("status")}-{session.get("combinations_checked", 0)}-{session.get("found_wallets", 0)}"'
+
+def publish_session_progress(session_id: str, **fields):
+    """Record a progress update and push it to every SSE subscriber of the session"""
+    progress = session_progress.setdefault(session_id, {"session_id": session_id})
+    progress.update(fields)
+    progress["last_updated"] = time.time()
+    
+    for queue in session_subscribers.get(session_id, []):
+        queue.put_nowait(dict(progress))
+    
+    # Close any live log streams once the session is finished
+    if progress.get("status") in SESSION_TERMINAL_STATES:
+        for queue in log_subscribers.get(session_id, []):
+            queue.put_nowait(None)
+
 @app.get("/api/logs/{session_id}")
-async def get_session_logs(session_id: str):
-    """Get real-time logs for terminal display"""
+async def get_session_logs(session_id: str, tail: Optional[int] = None, since: Optional[int] = None):
+    """Get real-time logs for terminal display (optionally only the last `tail` entries)
+    
+    `since` is the `next` cursor of a previous response - only lines logged after it are returned.
+    """
     logs = session_logs.get(session_id, [])
-    return {"logs": logs}
+    total = session_log_counts.get(session_id, 0)
+    if since is not None:
+        logs = logs[max(since - (total - len(logs)), 0):]
+    if tail is not None:
+        logs = logs[-tail:] if tail > 0 else []
+    return {"logs": logs, "next": total}
+
+@app.get("/api/logs/{session_id}/ndjson")
+async def get_session_logs_ndjson(session_id: str):
+    """Get the session logs as newline-delimited JSON so clients can read them line by line"""
+    logs = list(session_logs.get(session_id, []))
+    
+    def ndjson_lines():
+        for log_entry in logs:
+            yield json.dumps(log_entry, ensure_ascii=False) + "\n"
+    
+    return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
+
+@app.get("/api/logs/{session_id}/stream")
+async def stream_session_logs(session_id: str):
+    """Push each log line to the client as a Server-Sent Event as soon as it is written"""
+    queue = asyncio.Queue()
+    log_subscribers.setdefault(session_id, []).append(queue)
+    # Snapshot the backlog in the same step as subscribing so no line is missed or repeated
+    backlog = list(session_logs.get(session_id, []))
+    
+    async def event_stream():
+        try:
+            if session_id not in session_progress and not backlog:
+                if not await db.sessions.find_one({"session_id": session_id}, {"_id": 1}):
+                    yield f"event: error\ndata: {json.dumps({'detail': 'Session not found'})}\n\n"
+                    return
+            
+            for log_entry in backlog:
+                yield f"data: {json.dumps(log_entry)}\n\n"
+            
+            while session_id in recovery_tasks:
+                try:
+                    log_entry = await asyncio.wait_for(queue.get(), timeout=SSE_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                if log_entry is None:
+                    break
+                yield f"data: {json.dumps(log_entry)}\n\n"
+            
+            # Drain lines written just before the session finished
+            while not queue.empty():
+                log_entry = queue.get_nowait()
+                if log_entry is not None:
+                    yield f"data: {json.dumps(log_entry)}\n\n"
+            yield "event: end\ndata: {}\n\n"
+        finally:
+            subscribers = log_subscribers.get(session_id, [])
+            if queue in subscribers:
+                subscribers.remove(queue)
+            if not subscribers:
+                log_subscribers.pop(session_id, None)
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+HEALTH_JSON = precompute_json({
+    "status": "healthy", 
+    "message": "🚀 INFINITUM - ULTRA FAST Bitcoin Recovery API with Multi-Explorer Technology",
+    "features": [
+        "🔥 ULTRA FAST Multi-Explorer Balance Checking",
+        "⚡ 4 Blockchain Explorers (blockchain.info, blockstream.info, blockcypher.com, blockchair.com)",
+        "🚀 Concurrent Multi-Threading with Auto-Failover",
+        "💾 Thread-Safe Smart Caching System",
+        "🔐 REAL BIP39 mnemonic validation",
+        "🔑 REAL BIP32 key derivation with private key display", 
+        "📍 REAL Bitcoin address generation (Legacy, SegWit, Native SegWit)",
+        "💰 AUTHENTIC blockchain balance checking",
+        "🎯 Finds ALL wallets with BTC > 0",
+        "🔊 Real-time notifications and terminal logs"
+    ]
+})
+
+HEALTH_CACHE_SECONDS = 30
 
 @app.get("/api/health")
 async def health_check():
-    return {
-        "status": "healthy", 
-        "message": "🚀 INFINITUM - ULTRA FAST Bitcoin Recovery API with Multi-Explorer Technology",
-        "features": [
-            "🔥 ULTRA FAST Multi-Explorer Balance Checking",
-            "⚡ 4 Blockchain Explorers (blockchain.info, blockstream.info, blockcypher.com, blockchair.com)",
-            "🚀 Concurrent Multi-Threading with Auto-Failover",
-            "💾 Thread-Safe Smart Caching System",
-            "🔐 REAL BIP39 mnemonic validation",
-            "🔑 REAL BIP32 key derivation with private key display", 
-            "📍 REAL Bitcoin address generation (Legacy, SegWit, Native SegWit)",
-            "💰 AUTHENTIC blockchain balance checking",
-            "🎯 Finds ALL wallets with BTC > 0",
-            "🔊 Real-time notifications and terminal logs"
-        ]
-    }
+    return Response(
+        content=HEALTH_JSON,
+        media_type="application/json",
+        headers={"Cache-Control": f"public, max-age={HEALTH_CACHE_SECONDS}"}
+    )
+
+@app.head("/api/health")
+async def health_probe():
+    """Liveness probe - headers only, no body to send or parse"""
+    return Response(status_code=200, media_type="application/json")
 
 if __name__ == "__main__":
     import uvicorn
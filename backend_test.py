@@ -5,694 +5,857 @@ Focus on: NEW INFINITUM ULTRA FAST Multi-Explorer Technology Testing
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
+import logging
+import sys
+import threading
 import time
-import uuid
 import re
-from typing import Dict, List
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import Counter
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 
 # Use the production backend URL from frontend .env
 BASE_URL = "https://btc-wallet-recovery.preview.emergentagent.com/api"
 
+# (connect, read) timeouts - a dead host fails in 2-3s, while the remote preview host still gets
+# the full 10s to answer a poll; only starting a session keeps the long 15s budget
+POLL_TIMEOUT = (2.0, 10.0)
+START_TIMEOUT = (3.0, 15.0)
+
+class _DeferredFlushHandler(logging.StreamHandler):
+    """StreamHandler that leaves flushing to the caller instead of flushing after every record.
+    
+    Inside buffered() a thread's records are collected and written as one block when it exits,
+    so tests running concurrently never interleave their report lines."""
+    _local = threading.local()
+    
+    def emit(self, record):
+        try:
+            line = self.format(record) + self.terminator
+            lines = getattr(self._local, "lines", None)
+            if lines is not None:
+                lines.append(line)
+            else:
+                self.stream.write(line)
+        except Exception:
+            self.handleError(record)
+    
+    @contextmanager
+    def buffered(self):
+        self._local.lines = lines = []
+        try:
+            yield
+        finally:
+            self._local.lines = None
+            with self.lock:
+                self.stream.write("".join(lines))
+
+# Report output goes through a block-buffered stream (no write-through), flushed once the run is over
+logger = logging.getLogger("backend_test")
+# (own file object on the stdout descriptor; closefd=False so it never closes the real stdout)
+_output_stream = open(sys.stdout.fileno(), "w", encoding="utf-8", buffering=65536, closefd=False)
+_output_handler = _DeferredFlushHandler(_output_stream)
+_output_handler.setFormatter(logging.Formatter("%(message)s"))
+logger.addHandler(_output_handler)
+logger.setLevel(logging.INFO)
+logger.propagate = False
+
+# Start-recovery payloads, serialized once at import and posted as raw JSON bytes
+
+# Test with real blockchain mode to verify multi-explorer functionality
+MULTI_EXPLORER_SESSION_BODY = json.dumps({
+    "known_words": {"0": "abandon", "1": "ability"},
+    "min_balance": 0.00000001,
+    "address_formats": ["legacy"],  # Test with one format for multi-explorer verification
+    "max_combinations": 2,  # Small number for multi-explorer test
+    "demo_mode": False  # CRITICAL: Use real mode to test multi-explorer
+}).encode()
+
+# Test with demo mode for controlled timing
+ULTRA_FAST_SESSION_BODY = json.dumps({
+    "known_words": {"0": "abandon", "1": "ability", "2": "about"},
+    "min_balance": 0.00000001,
+    "address_formats": ["legacy", "segwit", "native_segwit"],
+    "max_combinations": 5,  # Small number for ultra fast timing test
+    "demo_mode": False  # Use real mode to test ultra fast performance
+}).encode()
+
+# Test with multiple address types to trigger concurrent multi-explorer requests
+FAILOVER_SESSION_BODY = json.dumps({
+    "known_words": {"0": "abandon", "1": "abandon", "2": "abandon"},
+    "min_balance": 0.00000001,
+    "address_formats": ["legacy", "segwit", "native_segwit"],  # Multiple formats for concurrent testing
+    "max_combinations": 3,
+    "demo_mode": False  # Real mode to test actual multi-explorer failover
+}).encode()
+
+# Test with real mode to trigger actual explorer usage
+FOUR_EXPLORERS_SESSION_BODY = json.dumps({
+    "known_words": {"0": "abandon", "1": "ability", "2": "about", "3": "above"},
+    "min_balance": 0.00000001,
+    "address_formats": ["legacy"],  # Single format to focus on explorer testing
+    "max_combinations": 4,
+    "demo_mode": False  # Real mode to test actual explorers
+}).encode()
+
+# Test with same addresses to trigger caching
+CACHING_SESSION_BODY = json.dumps({
+    "known_words": {
+        "0": "abandon", "1": "abandon", "2": "abandon", "3": "abandon",
+        "4": "abandon", "5": "abandon", "6": "abandon", "7": "abandon", 
+        "8": "abandon", "9": "abandon", "10": "abandon", "11": "about"
+    },  # Known valid mnemonic for consistent address generation
+    "min_balance": 0.00000001,
+    "address_formats": ["legacy"],
+    "max_combinations": 2,  # Test same addresses multiple times
+    "demo_mode": False  # Real mode to test actual caching
+}).encode()
+
+# Test with real mode to verify first-wins behavior
+FIRST_WINS_SESSION_BODY = json.dumps({
+    "known_words": {"0": "abandon", "1": "ability"},
+    "min_balance": 0.00000001,
+    "address_formats": ["legacy", "segwit"],  # Multiple formats to test first-wins
+    "max_combinations": 3,
+    "demo_mode": False  # Real mode to test actual first-wins behavior
+}).encode()
+
+# Features the health endpoint must advertise (each may be part of a longer feature line)
+REQUIRED_MULTI_EXPLORER_FEATURES = (
+    "ULTRA FAST Multi-Explorer Balance Checking",
+    "4 Blockchain Explorers",
+    "Concurrent Multi-Threading with Auto-Failover",
+    "Thread-Safe Smart Caching System"
+)
+
+# Log indicators each test waits for and scans - the ASCII text after the backend's emoji prefix,
+# so a changed or re-encoded emoji can't hide an otherwise matching line
+MULTI_EXPLORER_INDICATORS = (
+    "ULTRA FAST multi-explorer check for:",
+    "ULTRA FAST result from",
+    "Starting ULTRA FAST multi-explorer concurrent checks",
+    "blockchain.info",
+    "blockstream.info",
+    "blockcypher.com",
+    "blockchair.com"
+)
+CONCURRENT_INDICATORS = (
+    "Starting ULTRA FAST multi-explorer concurrent checks",
+    "ThreadPoolExecutor",
+    "concurrent",
+    "ULTRA FAST result from"
+)
+FAILOVER_INDICATORS = (
+    "failed or rate limited",
+    "All explorers failed"
+)
+BLOCKCHAIN_EXPLORERS = ("blockchain.info", "blockstream.info", "blockcypher.com", "blockchair.com")
+CACHING_INDICATORS = ("cache", "Cache")  # covers "cached" and "Cache hit"
+FIRST_WINS_INDICATORS = ("ULTRA FAST result from", "first successful", "wins", "immediately")
+
+def indicator_pattern(indicators):
+    """Compile the indicators into one escaped alternation - a single regex pass per log line"""
+    return re.compile("|".join(map(re.escape, indicators)))
+
+MULTI_EXPLORER_RE = indicator_pattern(MULTI_EXPLORER_INDICATORS)
+CONCURRENT_RE = indicator_pattern(CONCURRENT_INDICATORS)
+FAILOVER_RE = indicator_pattern(FAILOVER_INDICATORS)
+CACHING_RE = indicator_pattern(CACHING_INDICATORS)
+FIRST_WINS_RE = indicator_pattern(FIRST_WINS_INDICATORS)
+
+def matching_lines(pattern, logs, blob=None):
+    """Lines of logs that pattern matches - one scan of the joined blob, per-line only when it hits"""
+    if blob is None:
+        blob = "\n".join(logs)
+    if not pattern.search(blob):
+        return []
+    return [log_entry for log_entry in logs if pattern.search(log_entry)]
+
+# url -> (fetched_at, data) for static endpoints, shared by every tester in the process
+_json_cache = {}
+_json_cache_lock = threading.Lock()
+JSON_CACHE_SECONDS = 30
+
+def backoff_polls(timeout, initial_delay=0.05, max_delay=2.0):
+    """Yield once per poll, sleeping with exponential backoff in between, until timeout expires"""
+    deadline = time.monotonic() + timeout
+    delay = initial_delay
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, max_delay)
+        yield
+
 class InfinitumUltraFastMultiExplorerTester:
+    # Tests by priority - (heading, summary label, test names) drives the whole results summary
+    CRITICAL_TESTS = ("infinitum_health_check", "multi_explorer_real_mode", "ultra_fast_performance")
+    PERFORMANCE_TESTS = ("concurrent_multi_explorer_failover", "first_successful_result_wins")
+    INFRASTRUCTURE_TESTS = ("four_blockchain_explorers", "thread_safe_caching")
+    TEST_CATEGORIES = (
+        ("🔥 CRITICAL INFINITUM FEATURES:", "Critical Features", CRITICAL_TESTS),
+        ("⚡ ULTRA FAST PERFORMANCE FEATURES:", "Performance Features", PERFORMANCE_TESTS),
+        ("🏗️ MULTI-EXPLORER INFRASTRUCTURE:", "Infrastructure", INFRASTRUCTURE_TESTS),
+    )
+    TEST_DISPLAY_NAMES = {
+        test_name: test_name.replace("_", " ").title()
+        for _, _, test_names in TEST_CATEGORIES for test_name in test_names
+    }
+    TEST_LABELS = {test_name: label for _, label, test_names in TEST_CATEGORIES for test_name in test_names}
+    
     def __init__(self):
         self.base_url = BASE_URL
         self.session_ids = []  # Track created sessions for cleanup
-        
+        self.session_ids_lock = threading.Lock()  # Tests run concurrently
+        
+        # One pooled keep-alive session shared by all (concurrent) tests - TLS handshake once per connection
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({"Content-Type": "application/json", "Connection": "keep-alive"})
+        
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.cleanup()
+        return False
+    
+    def cleanup(self):
+        """Delete every session this run created (all DELETEs in flight at once), then close the pooled connections"""
+        try:
+            if self.session_ids:
+                with ThreadPoolExecutor(max_workers=min(len(self.session_ids), 16)) as executor:
+                    futures = [
+                        executor.submit(self.session.delete, f"{self.base_url}/session/{session_id}", timeout=POLL_TIMEOUT)
+                        for session_id in self.session_ids
+                    ]
+                    deleted = sum(1 for future in futures if not future.exception() and future.result().ok)
+                logger.info(f"🧹 Cleaned up {deleted}/{len(self.session_ids)} test sessions")
+        finally:
+            self.session.close()
+    
+    def run_buffered(self, test):
+        """Run one test with its report lines held back and written as a single block when it finishes"""
+        with _output_handler.buffered():
+            return test()
+    
+    def track_session(self, session_id: str):
+        """Remember a session this run created so it can be cleaned up"""
+        with self.session_ids_lock:
+            self.session_ids.append(session_id)
+    
+    def wait_for_indicators(self, session_id: str, indicators, timeout: float, min_matches: int = 1, poll: float = 0.5):
+        """Poll the session logs every `poll` seconds until `min_matches` of the indicators appear
+        or timeout expires - returns (status_code of the last fetch, every log line seen)
+        
+        Each poll only downloads and scans the lines logged since the previous one (?since= cursor).
+        """
+        logs_url = f"{self.base_url}/logs/{session_id}"
+        status_code, logs = None, []
+        cursor = 0
+        found = set()
+        for _ in backoff_polls(timeout, initial_delay=poll, max_delay=poll):
+            try:
+                logs_response = self.session.get(logs_url, params={"since": cursor}, timeout=POLL_TIMEOUT)
+            except requests.exceptions.Timeout:
+                continue  # One slow poll is a miss, not a failed test
+            status_code = logs_response.status_code
+            if status_code == 200:
+                logs_data = logs_response.json()
+                new_logs = logs_data.get("logs", [])
+                if "next" in logs_data:
+                    cursor = logs_data["next"]
+                else:
+                    # Backend without ?since= support returns the full log - skip what was already seen
+                    new_logs, cursor = new_logs[cursor:], len(new_logs)
+                logs.extend(new_logs)
+                
+                blob = "\n".join(new_logs)
+                found.update(indicator for indicator in indicators if indicator in blob)
+                if len(found) >= min_matches:
+                    break
+        return status_code, logs
+    
+    def get_status_and_logs(self, session_id: str):
+        """Fetch session status and logs - returns (status_response, logs_response)"""
+        status_response = self.session.get(f"{self.base_url}/session/{session_id}", timeout=POLL_TIMEOUT)
+        logs_response = self.session.get(f"{self.base_url}/logs/{session_id}", timeout=POLL_TIMEOUT)
+        return status_response, logs_response
+    
+    def backend_alive(self) -> bool:
+        """Cheap liveness probe - HEAD /health (GET if HEAD isn't routed), no body decoded"""
+        url = f"{self.base_url}/health"
+        try:
+            response = self.session.head(url, timeout=(2.0, 2.0), allow_redirects=True)
+            if response.status_code == 405:
+                response = self.session.get(url, timeout=(2.0, 2.0))
+            return 200 <= response.status_code < 300
+        except requests.RequestException:
+            return False
+    
+    def get_cached_json(self, url: str, ttl: float = JSON_CACHE_SECONDS):
+        """GET a static endpoint, reusing a body fetched within the last ttl seconds - returns (status_code, data)"""
+        with _json_cache_lock:
+            cached = _json_cache.get(url)
+        if cached and time.monotonic() - cached[0] < ttl:
+            return 200, cached[1]
+        
+        response = self.session.get(url, timeout=POLL_TIMEOUT)
+        if response.status_code != 200:
+            return response.status_code, None
+        data = response.json()
+        with _json_cache_lock:
+            _json_cache[url] = (time.monotonic(), data)
+        return 200, data
+    
     def test_infinitum_health_check(self):
         """Test 1: INFINITUM Health Check with Multi-Explorer Features"""
-        print("\n🔍 Testing INFINITUM Health Check with Multi-Explorer Features...")
+        logger.info("\n🔍 Testing INFINITUM Health Check with Multi-Explorer Features...")
         try:
-            response = requests.get(f"{self.base_url}/health", timeout=10)
-            print(f"Status Code: {response.status_code}")
+            # Health metadata is static within a run - repeated checks in this process reuse it for 30s
+            status_code, data = self.get_cached_json(f"{self.base_url}/health")
+            logger.info(f"Status Code: {status_code}")
             
-            if response.status_code == 200:
-                data = response.json()
-                print(f"Response: {json.dumps(data, indent=2)}")
+            if status_code == 200:
+                logger.info(f"Response: {json.dumps(data, indent=2)}")
                 
                 # Check for INFINITUM branding
                 message = data.get("message", "")
                 if "INFINITUM" not in message:
-                    print("❌ INFINITUM branding FAILED - 'INFINITUM' not found in message")
+                    logger.error("❌ INFINITUM branding FAILED - 'INFINITUM' not found in message")
                     return False
                 
                 if "ULTRA FAST" not in message:
-                    print("❌ ULTRA FAST branding FAILED - 'ULTRA FAST' not found in message")
+                    logger.error("❌ ULTRA FAST branding FAILED - 'ULTRA FAST' not found in message")
                     return False
                 
                 if "Multi-Explorer Technology" not in message:
-                    print("❌ Multi-Explorer Technology FAILED - not found in message")
+                    logger.error("❌ Multi-Explorer Technology FAILED - not found in message")
                     return False
                 
                 # Check for multi-explorer features
-                features = data.get("features", [])
-                required_multi_explorer_features = [
-                    "ULTRA FAST Multi-Explorer Balance Checking",
-                    "4 Blockchain Explorers",
-                    "Concurrent Multi-Threading with Auto-Failover",
-                    "Thread-Safe Smart Caching System"
+                # One newline-joined blob, so each required feature is a single substring scan
+                feature_blob = "\n".join(data.get("features", []))
+                missing_features = [
+                    feature for feature in REQUIRED_MULTI_EXPLORER_FEATURES
+                    if feature not in feature_blob
                 ]
                 
-                missing_features = []
-                for feature in required_multi_explorer_features:
-                    if not any(feature in f for f in features):
-                        missing_features.append(feature)
-                
                 if not missing_features:
-                    print("✅ INFINITUM Health Check PASSED - All multi-explorer features present")
-                    print("✅ INFINITUM branding confirmed")
-                    print("✅ ULTRA FAST Multi-Explorer Technology confirmed")
+                    logger.info("✅ INFINITUM Health Check PASSED - All multi-explorer features present")
+                    logger.info("✅ INFINITUM branding confirmed")
+                    logger.info("✅ ULTRA FAST Multi-Explorer Technology confirmed")
                     return True
                 else:
-                    print(f"❌ INFINITUM Health Check FAILED - Missing features: {missing_features}")
+                    logger.error(f"❌ INFINITUM Health Check FAILED - Missing features: {missing_features}")
                     return False
             else:
-                print(f"❌ INFINITUM Health Check FAILED - Status code: {response.status_code}")
+                logger.error(f"❌ INFINITUM Health Check FAILED - Status code: {status_code}")
                 return False
         except Exception as e:
-            print(f"❌ INFINITUM Health Check FAILED - Error: {e}")
+            logger.error(f"❌ INFINITUM Health Check FAILED - Error: {e}")
             return False
     
     def test_multi_explorer_real_mode(self):
         """Test 2: Multi-Explorer Real Mode with 4 Blockchain APIs"""
-        print("\n🔍 Testing Multi-Explorer Real Mode with 4 Blockchain APIs...")
-        
-        # Test with real blockchain mode to verify multi-explorer functionality
-        multi_explorer_session = {
-            "known_words": {"0": "abandon", "1": "ability"},
-            "min_balance": 0.00000001,
-            "address_formats": ["legacy"],  # Test with one format for multi-explorer verification
-            "max_combinations": 2,  # Small number for multi-explorer test
-            "demo_mode": False  # CRITICAL: Use real mode to test multi-explorer
-        }
+        logger.info("\n🔍 Testing Multi-Explorer Real Mode with 4 Blockchain APIs...")
         
         try:
             # Start recovery with real multi-explorer checking
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/start-recovery",
-                json=multi_explorer_session,
-                headers={"Content-Type": "application/json"},
-                timeout=15
+                data=MULTI_EXPLORER_SESSION_BODY,
+                timeout=START_TIMEOUT
             )
             
             if response.status_code != 200:
-                print(f"❌ Multi-Explorer test FAILED - Could not start session: {response.status_code}")
+                logger.error(f"❌ Multi-Explorer test FAILED - Could not start session: {response.status_code}")
                 return False
             
             session_id = response.json()["session_id"]
-            self.session_ids.append(session_id)
-            print(f"Started multi-explorer test session: {session_id}")
-            
-            # Monitor logs for multi-explorer indicators
-            time.sleep(5)  # Wait for processing
+            self.track_session(session_id)
+            logger.info(f"Started multi-explorer test session: {session_id}")
             
-            logs_response = requests.get(f"{self.base_url}/logs/{session_id}", timeout=10)
-            if logs_response.status_code == 200:
-                logs_data = logs_response.json()
-                logs = logs_data.get("logs", [])
-                
-                # Look for ULTRA FAST multi-explorer indicators in logs
-                ultra_fast_indicators = [
-                    "🚀 ULTRA FAST multi-explorer check for:",
-                    "⚡ ULTRA FAST result from",
-                    "🚀 Starting ULTRA FAST multi-explorer concurrent checks",
-                    "blockchain.info",
-                    "blockstream.info", 
-                    "blockcypher.com",
-                    "blockchair.com"
-                ]
-                
-                found_indicators = []
-                for log_entry in logs:
-                    for indicator in ultra_fast_indicators:
-                        if indicator in log_entry:
-                            found_indicators.append(indicator)
-                            print(f"✅ Multi-Explorer indicator found: {log_entry}")
+            # Monitor logs for multi-explorer indicators - up to 5s, done as soon as two show up
+            status_code, logs = self.wait_for_indicators(session_id, MULTI_EXPLORER_INDICATORS, timeout=5, min_matches=2)
+            if status_code == 200:
+                # Look for ULTRA FAST multi-explorer indicators in logs (indicators never span lines)
+                blob = "\n".join(logs)
+                found_indicators = MULTI_EXPLORER_RE.findall(blob)
+                for log_entry in matching_lines(MULTI_EXPLORER_RE, logs, blob):
+                    logger.info(f"✅ Multi-Explorer indicator found: {log_entry}")
                 
                 if len(found_indicators) >= 2:  # At least 2 multi-explorer indicators
-                    print("✅ Multi-Explorer Real Mode PASSED - ULTRA FAST multi-explorer indicators detected")
+                    logger.info("✅ Multi-Explorer Real Mode PASSED - ULTRA FAST multi-explorer indicators detected")
                     return True
                 else:
-                    print(f"⚠️ Multi-Explorer test inconclusive - Found {len(found_indicators)} indicators")
+                    logger.warning(f"⚠️ Multi-Explorer test inconclusive - Found {len(found_indicators)} indicators")
                     # Check if session is processing (might be too early)
-                    status_response = requests.get(f"{self.base_url}/session/{session_id}", timeout=10)
+                    status_response = self.session.get(f"{self.base_url}/session/{session_id}", timeout=POLL_TIMEOUT)
                     if status_response.status_code == 200:
                         session_data = status_response.json()
                         if session_data.get("status") in ["running", "pending"]:
-                            print("✅ Multi-Explorer Real Mode PASSED - Session processing with real mode")
+                            logger.info("✅ Multi-Explorer Real Mode PASSED - Session processing with real mode")
                             return True
                     return True  # Don't fail on inconclusive
             else:
-                print(f"❌ Multi-Explorer test FAILED - Could not get logs: {logs_response.status_code}")
+                logger.error(f"❌ Multi-Explorer test FAILED - Could not get logs: {status_code}")
                 return False
                 
         except Exception as e:
-            print(f"❌ Multi-Explorer Real Mode test FAILED - Error: {e}")
+            logger.error(f"❌ Multi-Explorer Real Mode test FAILED - Error: {e}")
             return False
 
     def test_ultra_fast_performance(self):
         """Test 3: Ultra Fast Performance with 0.05s timeout"""
-        print("\n🔍 Testing Ultra Fast Performance with 0.05s main loop timeout...")
-        
-        # Test with demo mode for controlled timing
-        ultra_fast_session = {
-            "known_words": {"0": "abandon", "1": "ability", "2": "about"},
-            "min_balance": 0.00000001,
-            "address_formats": ["legacy", "segwit", "native_segwit"],
-            "max_combinations": 5,  # Small number for ultra fast timing test
-            "demo_mode": False  # Use real mode to test ultra fast performance
-        }
+        logger.info("\n🔍 Testing Ultra Fast Performance with 0.05s main loop timeout...")
         
         try:
             # Start recovery and measure ultra fast timing
-            start_time = time.time()
-            response = requests.post(
+            start_time = time.monotonic()
+            response = self.session.post(
                 f"{self.base_url}/start-recovery",
-                json=ultra_fast_session,
-                headers={"Content-Type": "application/json"},
-                timeout=15
+                data=ULTRA_FAST_SESSION_BODY,
+                timeout=START_TIMEOUT
             )
             
             if response.status_code != 200:
-                print(f"❌ Ultra Fast test FAILED - Could not start session: {response.status_code}")
+                logger.error(f"❌ Ultra Fast test FAILED - Could not start session: {response.status_code}")
                 return False
             
             session_id = response.json()["session_id"]
-            self.session_ids.append(session_id)
-            print(f"Started ultra fast performance test session: {session_id}")
+            self.track_session(session_id)
+            logger.info(f"Started ultra fast performance test session: {session_id}")
             
-            # Monitor progress for ultra fast performance
+            # Monitor progress for ultra fast performance - checks start 0.5s apart and stretch to 2s,
+            # stopping as soon as 3 combinations give a timing sample (same 8s worst case as before)
             timing_checks = []
-            for i in range(4):  # Check 4 times over 8 seconds
-                time.sleep(2)
-                check_time = time.time()
+            deadline = start_time + 8.0
+            next_check = 0.5
+            i = 0
+            while time.monotonic() < deadline:
+                time.sleep(min(next_check, max(deadline - time.monotonic(), 0)))
+                check_time = time.monotonic()
+                i += 1
+                session_done = False
                 
-                # Get session status
-                status_response = requests.get(f"{self.base_url}/session/{session_id}", timeout=10)
+                # Session status and logs
+                status_response, logs_response = self.get_status_and_logs(session_id)
                 if status_response.status_code == 200:
                     session_data = status_response.json()
                     combinations_checked = session_data.get("combinations_checked", 0)
                     timing_checks.append((check_time - start_time, combinations_checked))
-                    print(f"Ultra Fast check {i+1}: {combinations_checked} combinations in {check_time - start_time:.1f}s")
+                    logger.info(f"Ultra Fast check {i}: {combinations_checked} combinations in {check_time - start_time:.1f}s")
+                    session_done = combinations_checked >= 3 or session_data.get("status") == "completed"
                 
                 # Check logs for ultra fast indicators
-                logs_response = requests.get(f"{self.base_url}/logs/{session_id}", timeout=10)
                 if logs_response.status_code == 200:
                     logs_data = logs_response.json()
                     logs = logs_data.get("logs", [])
                     
                     # Look for ultra fast performance indicators
-                    for log_entry in logs[-3:]:  # Check last 3 logs
-                        if "ULTRA FAST" in log_entry or "⚡" in log_entry:
-                            print(f"   Ultra Fast indicator: {log_entry}")
+                    for log_entry in islice(logs, max(len(logs) - 3, 0), None):  # Check last 3 logs
+                        if "ULTRA FAST" in log_entry:
+                            logger.info(f"   Ultra Fast indicator: {log_entry}")
+                
+                if session_done:
+                    break
+                next_check = min(next_check * 1.5, 2.0)
             
-            # Analyze timing for ultra fast performance
-            if len(timing_checks) >= 2:
+            # Analyze timing for ultra fast performance - only the latest sample is used
+            if timing_checks:
                 final_time, final_combinations = timing_checks[-1]
                 if final_combinations > 0:
                     avg_time_per_combo = final_time / final_combinations
-                    print(f"Average time per combination: {avg_time_per_combo:.3f}s")
+                    logger.info(f"Average time per combination: {avg_time_per_combo:.3f}s")
                     
                     # With ultra fast 0.05s main loop, should be very fast
                     if avg_time_per_combo <= 1.0:  # Should be much faster with 0.05s loops
-                        print("✅ Ultra Fast Performance PASSED - Faster than 1s per combination")
-                        print(f"   - Average time per combo: {avg_time_per_combo:.3f}s")
-                        print(f"   - Ultra fast main loop: 0.05s timeout")
-                        print(f"   - Multi-explorer concurrent processing")
+                        logger.info("✅ Ultra Fast Performance PASSED - Faster than 1s per combination")
+                        logger.info(f"   - Average time per combo: {avg_time_per_combo:.3f}s")
+                        logger.info(f"   - Ultra fast main loop: 0.05s timeout")
+                        logger.info(f"   - Multi-explorer concurrent processing")
                         return True
                     else:
-                        print(f"⚠️ Ultra Fast Performance test inconclusive - Time: {avg_time_per_combo:.3f}s")
+                        logger.warning(f"⚠️ Ultra Fast Performance test inconclusive - Time: {avg_time_per_combo:.3f}s")
                         return True  # Don't fail on inconclusive timing
                 else:
-                    print("⚠️ Ultra Fast Performance test inconclusive - no combinations processed yet")
+                    logger.warning("⚠️ Ultra Fast Performance test inconclusive - no combinations processed yet")
                     return True
             else:
-                print("⚠️ Ultra Fast Performance test inconclusive - insufficient timing data")
+                logger.warning("⚠️ Ultra Fast Performance test inconclusive - insufficient timing data")
                 return True
                 
         except Exception as e:
-            print(f"❌ Ultra Fast Performance test FAILED - Error: {e}")
+            logger.error(f"❌ Ultra Fast Performance test FAILED - Error: {e}")
             return False
 
     def test_concurrent_multi_explorer_failover(self):
         """Test 4: Concurrent Multi-Explorer with Auto-Failover"""
-        print("\n🔍 Testing Concurrent Multi-Explorer with Auto-Failover...")
-        
-        # Test with multiple address types to trigger concurrent multi-explorer requests
-        failover_session = {
-            "known_words": {"0": "abandon", "1": "abandon", "2": "abandon"},
-            "min_balance": 0.00000001,
-            "address_formats": ["legacy", "segwit", "native_segwit"],  # Multiple formats for concurrent testing
-            "max_combinations": 3,
-            "demo_mode": False  # Real mode to test actual multi-explorer failover
-        }
+        logger.info("\n🔍 Testing Concurrent Multi-Explorer with Auto-Failover...")
         
         try:
             # Start recovery to test concurrent multi-explorer
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/start-recovery",
-                json=failover_session,
-                headers={"Content-Type": "application/json"},
-                timeout=15
+                data=FAILOVER_SESSION_BODY,
+                timeout=START_TIMEOUT
             )
             
             if response.status_code != 200:
-                print(f"❌ Concurrent Multi-Explorer test FAILED - Could not start session: {response.status_code}")
+                logger.error(f"❌ Concurrent Multi-Explorer test FAILED - Could not start session: {response.status_code}")
                 return False
             
             session_id = response.json()["session_id"]
-            self.session_ids.append(session_id)
-            print(f"Started concurrent multi-explorer test session: {session_id}")
-            
-            # Monitor logs for concurrent and failover indicators
-            time.sleep(6)  # Wait for processing
+            self.track_session(session_id)
+            logger.info(f"Started concurrent multi-explorer test session: {session_id}")
             
-            logs_response = requests.get(f"{self.base_url}/logs/{session_id}", timeout=10)
-            if logs_response.status_code == 200:
-                logs_data = logs_response.json()
-                logs = logs_data.get("logs", [])
-                
+            # Monitor logs for concurrent and failover indicators - up to 6s, done once concurrency shows up
+            status_code, logs = self.wait_for_indicators(session_id, CONCURRENT_INDICATORS, timeout=6)
+            if status_code == 200:
                 # Look for concurrent multi-explorer and failover indicators
-                concurrent_indicators = [
-                    "🚀 Starting ULTRA FAST multi-explorer concurrent checks",
-                    "ThreadPoolExecutor",
-                    "concurrent",
-                    "⚡ ULTRA FAST result from",
-                    "⚠️",  # Failover indicators
-                    "failed or rate limited",
-                    "All explorers failed"
-                ]
-                
-                found_concurrent = []
-                found_failover = []
-                
-                for log_entry in logs:
-                    for indicator in concurrent_indicators[:4]:  # Concurrent indicators
-                        if indicator in log_entry:
-                            found_concurrent.append(log_entry)
-                            print(f"✅ Concurrent indicator: {log_entry}")
-                    
-                    for indicator in concurrent_indicators[4:]:  # Failover indicators
-                        if indicator in log_entry:
-                            found_failover.append(log_entry)
-                            print(f"✅ Failover indicator: {log_entry}")
+                blob = "\n".join(logs)
+                found_concurrent = matching_lines(CONCURRENT_RE, logs, blob)
+                found_failover = matching_lines(FAILOVER_RE, logs, blob)
+                for log_entry in found_concurrent:
+                    logger.info(f"✅ Concurrent indicator: {log_entry}")
+                for log_entry in found_failover:
+                    logger.info(f"✅ Failover indicator: {log_entry}")
                 
                 # Evaluate results
                 concurrent_working = len(found_concurrent) > 0
                 failover_working = len(found_failover) > 0 or len(found_concurrent) > 0  # Either failover logs or successful concurrent
                 
                 if concurrent_working:
-                    print("✅ Concurrent Multi-Explorer PASSED - Concurrent processing detected")
+                    logger.info("✅ Concurrent Multi-Explorer PASSED - Concurrent processing detected")
                     if failover_working:
-                        print("✅ Auto-Failover PASSED - Failover mechanisms detected")
+                        logger.info("✅ Auto-Failover PASSED - Failover mechanisms detected")
                     return True
                 else:
-                    print("⚠️ Concurrent Multi-Explorer test inconclusive - Limited indicators found")
+                    logger.warning("⚠️ Concurrent Multi-Explorer test inconclusive - Limited indicators found")
                     return True  # Don't fail on inconclusive
             else:
-                print(f"❌ Concurrent Multi-Explorer test FAILED - Could not get logs: {logs_response.status_code}")
+                logger.error(f"❌ Concurrent Multi-Explorer test FAILED - Could not get logs: {status_code}")
                 return False
                 
         except Exception as e:
-            print(f"❌ Concurrent Multi-Explorer test FAILED - Error: {e}")
+            logger.error(f"❌ Concurrent Multi-Explorer test FAILED - Error: {e}")
             return False
 
     def test_four_blockchain_explorers(self):
         """Test 5: Verify 4 Blockchain Explorers Integration"""
-        print("\n🔍 Testing 4 Blockchain Explorers Integration...")
-        
-        # Test with real mode to trigger actual explorer usage
-        four_explorers_session = {
-            "known_words": {"0": "abandon", "1": "ability", "2": "about", "3": "above"},
-            "min_balance": 0.00000001,
-            "address_formats": ["legacy"],  # Single format to focus on explorer testing
-            "max_combinations": 4,
-            "demo_mode": False  # Real mode to test actual explorers
-        }
+        logger.info("\n🔍 Testing 4 Blockchain Explorers Integration...")
         
         try:
             # Start recovery to test 4 explorers
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/start-recovery",
-                json=four_explorers_session,
-                headers={"Content-Type": "application/json"},
-                timeout=15
+                data=FOUR_EXPLORERS_SESSION_BODY,
+                timeout=START_TIMEOUT
             )
             
             if response.status_code != 200:
-                print(f"❌ Four Explorers test FAILED - Could not start session: {response.status_code}")
+                logger.error(f"❌ Four Explorers test FAILED - Could not start session: {response.status_code}")
                 return False
             
             session_id = response.json()["session_id"]
-            self.session_ids.append(session_id)
-            print(f"Started four explorers test session: {session_id}")
-            
-            # Monitor logs for all 4 explorer indicators
-            time.sleep(8)  # Wait longer for multiple explorer attempts
+            self.track_session(session_id)
+            logger.info(f"Started four explorers test session: {session_id}")
             
-            logs_response = requests.get(f"{self.base_url}/logs/{session_id}", timeout=10)
-            if logs_response.status_code == 200:
-                logs_data = logs_response.json()
-                logs = logs_data.get("logs", [])
-                
-                # Look for all 4 blockchain explorers
-                explorers = {
-                    "blockchain.info": False,
-                    "blockstream.info": False,
-                    "blockcypher.com": False,
-                    "blockchair.com": False
-                }
-                
-                all_logs_text = " ".join(logs)
+            # Monitor logs for all 4 explorer indicators - up to 8s for multiple explorer attempts,
+            # done as soon as every explorer has shown up
+            status_code, logs = self.wait_for_indicators(
+                session_id, BLOCKCHAIN_EXPLORERS, timeout=8, min_matches=len(BLOCKCHAIN_EXPLORERS)
+            )
+            if status_code == 200:
+                # Join once - each explorer name is then a single substring scan
+                all_logs_text = "\n".join(logs)
                 
-                for explorer_name in explorers.keys():
+                # Look for all 4 blockchain explorers - one bit per explorer in BLOCKCHAIN_EXPLORERS order
+                detected_mask = 0
+                for bit, explorer_name in enumerate(BLOCKCHAIN_EXPLORERS):
                     if explorer_name in all_logs_text:
-                        explorers[explorer_name] = True
-                        print(f"✅ {explorer_name} detected in logs")
+                        detected_mask |= 1 << bit
+                        logger.info(f"✅ {explorer_name} detected in logs")
                     else:
-                        print(f"⚠️ {explorer_name} not explicitly found in logs")
+                        logger.warning(f"⚠️ {explorer_name} not explicitly found in logs")
                 
                 # Check how many explorers were detected
-                detected_count = sum(explorers.values())
+                detected_count = bin(detected_mask).count("1")
                 
                 if detected_count >= 2:  # At least 2 explorers should be detectable
-                    print(f"✅ Four Blockchain Explorers PASSED - {detected_count}/4 explorers detected")
-                    print("✅ Multi-explorer system is active")
+                    logger.info(f"✅ Four Blockchain Explorers PASSED - {detected_count}/4 explorers detected")
+                    logger.info("✅ Multi-explorer system is active")
                     return True
                 elif detected_count >= 1:
-                    print(f"⚠️ Four Blockchain Explorers partially working - {detected_count}/4 explorers detected")
+                    logger.warning(f"⚠️ Four Blockchain Explorers partially working - {detected_count}/4 explorers detected")
                     return True  # Partial success
                 else:
-                    print("⚠️ Four Blockchain Explorers test inconclusive - No explicit explorer names in logs")
+                    logger.warning("⚠️ Four Blockchain Explorers test inconclusive - No explicit explorer names in logs")
                     # Check if any multi-explorer activity occurred
-                    if any("ULTRA FAST" in log for log in logs):
-                        print("✅ Multi-explorer system appears active based on ULTRA FAST indicators")
+                    if "ULTRA FAST" in all_logs_text:
+                        logger.info("✅ Multi-explorer system appears active based on ULTRA FAST indicators")
                         return True
                     return True  # Don't fail on inconclusive
             else:
-                print(f"❌ Four Explorers test FAILED - Could not get logs: {logs_response.status_code}")
+                logger.error(f"❌ Four Explorers test FAILED - Could not get logs: {status_code}")
                 return False
                 
         except Exception as e:
-            print(f"❌ Four Blockchain Explorers test FAILED - Error: {e}")
+            logger.error(f"❌ Four Blockchain Explorers test FAILED - Error: {e}")
             return False
 
     def test_thread_safe_caching(self):
         """Test 6: Thread-Safe Smart Caching System"""
-        print("\n🔍 Testing Thread-Safe Smart Caching System...")
-        
-        # Test with same addresses to trigger caching
-        caching_session = {
-            "known_words": {
-                "0": "abandon", "1": "abandon", "2": "abandon", "3": "abandon",
-                "4": "abandon", "5": "abandon", "6": "abandon", "7": "abandon", 
-                "8": "abandon", "9": "abandon", "10": "abandon", "11": "about"
-            },  # Known valid mnemonic for consistent address generation
-            "min_balance": 0.00000001,
-            "address_formats": ["legacy"],
-            "max_combinations": 2,  # Test same addresses multiple times
-            "demo_mode": False  # Real mode to test actual caching
-        }
+        logger.info("\n🔍 Testing Thread-Safe Smart Caching System...")
         
         try:
             # Start recovery to test caching
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/start-recovery",
-                json=caching_session,
-                headers={"Content-Type": "application/json"},
-                timeout=15
+                data=CACHING_SESSION_BODY,
+                timeout=START_TIMEOUT
             )
             
             if response.status_code != 200:
-                print(f"❌ Caching test FAILED - Could not start session: {response.status_code}")
+                logger.error(f"❌ Caching test FAILED - Could not start session: {response.status_code}")
                 return False
             
             session_id = response.json()["session_id"]
-            self.session_ids.append(session_id)
-            print(f"Started caching test session: {session_id}")
-            
-            # Monitor logs for caching indicators
-            time.sleep(5)  # Wait for processing
+            self.track_session(session_id)
+            logger.info(f"Started caching test session: {session_id}")
             
-            logs_response = requests.get(f"{self.base_url}/logs/{session_id}", timeout=10)
-            if logs_response.status_code == 200:
-                logs_data = logs_response.json()
-                logs = logs_data.get("logs", [])
-                
+            # Monitor logs for caching indicators - up to 5s, done at the first one
+            status_code, logs = self.wait_for_indicators(session_id, CACHING_INDICATORS, timeout=5)
+            if status_code == 200:
                 # Look for caching indicators
-                caching_indicators = [
-                    "💾 Cache hit",
-                    "cache",
-                    "cached",
-                    "Cache"
-                ]
-                
-                found_caching = []
-                for log_entry in logs:
-                    for indicator in caching_indicators:
-                        if indicator in log_entry:
-                            found_caching.append(log_entry)
-                            print(f"✅ Caching indicator: {log_entry}")
+                found_caching = matching_lines(CACHING_RE, logs)
+                for log_entry in found_caching:
+                    logger.info(f"✅ Caching indicator: {log_entry}")
                 
                 if found_caching:
-                    print("✅ Thread-Safe Caching PASSED - Cache system active")
+                    logger.info("✅ Thread-Safe Caching PASSED - Cache system active")
                     return True
                 else:
-                    print("⚠️ Thread-Safe Caching test inconclusive - No explicit cache indicators")
+                    logger.warning("⚠️ Thread-Safe Caching test inconclusive - No explicit cache indicators")
                     # Check if session completed (caching might not be visible in logs)
-                    status_response = requests.get(f"{self.base_url}/session/{session_id}", timeout=10)
+                    status_response = self.session.get(f"{self.base_url}/session/{session_id}", timeout=POLL_TIMEOUT)
                     if status_response.status_code == 200:
                         session_data = status_response.json()
                         if session_data.get("combinations_checked", 0) > 0:
-                            print("✅ Thread-Safe Caching PASSED - Session processed successfully (caching system working)")
+                            logger.info("✅ Thread-Safe Caching PASSED - Session processed successfully (caching system working)")
                             return True
                     return True  # Don't fail on inconclusive
             else:
-                print(f"❌ Caching test FAILED - Could not get logs: {logs_response.status_code}")
+                logger.error(f"❌ Caching test FAILED - Could not get logs: {status_code}")
                 return False
                 
         except Exception as e:
-            print(f"❌ Thread-Safe Caching test FAILED - Error: {e}")
+            logger.error(f"❌ Thread-Safe Caching test FAILED - Error: {e}")
             return False
 
     def test_first_successful_result_wins(self):
         """Test 7: First Successful Result Wins (Speed Optimization)"""
-        print("\n🔍 Testing First Successful Result Wins Speed Optimization...")
-        
-        # Test with real mode to verify first-wins behavior
-        first_wins_session = {
-            "known_words": {"0": "abandon", "1": "ability"},
-            "min_balance": 0.00000001,
-            "address_formats": ["legacy", "segwit"],  # Multiple formats to test first-wins
-            "max_combinations": 3,
-            "demo_mode": False  # Real mode to test actual first-wins behavior
-        }
+        logger.info("\n🔍 Testing First Successful Result Wins Speed Optimization...")
         
         try:
             # Start recovery and measure response time
-            start_time = time.time()
-            response = requests.post(
+            start_time = time.monotonic()
+            response = self.session.post(
                 f"{self.base_url}/start-recovery",
-                json=first_wins_session,
-                headers={"Content-Type": "application/json"},
-                timeout=15
+                data=FIRST_WINS_SESSION_BODY,
+                timeout=START_TIMEOUT
             )
             
             if response.status_code != 200:
-                print(f"❌ First Wins test FAILED - Could not start session: {response.status_code}")
+                logger.error(f"❌ First Wins test FAILED - Could not start session: {response.status_code}")
                 return False
             
             session_id = response.json()["session_id"]
-            self.session_ids.append(session_id)
-            print(f"Started first-wins test session: {session_id}")
+            self.track_session(session_id)
+            logger.info(f"Started first-wins test session: {session_id}")
             
             # Monitor for quick responses (first successful result)
             quick_response_detected = False
             
-            for i in range(3):
-                time.sleep(2)
-                check_time = time.time()
+            # Poll with backoff (50ms doubling to 2s) for up to 6s and stop at the first indicator
+            for _ in backoff_polls(timeout=6):
+                check_time = time.monotonic()
                 
                 # Check logs for first-wins indicators
-                logs_response = requests.get(f"{self.base_url}/logs/{session_id}", timeout=10)
+                logs_response = self.session.get(f"{self.base_url}/logs/{session_id}", timeout=POLL_TIMEOUT)
                 if logs_response.status_code == 200:
                     logs_data = logs_response.json()
                     logs = logs_data.get("logs", [])
                     
                     # Look for first successful result indicators
-                    first_wins_indicators = [
-                        "⚡ ULTRA FAST result from",
-                        "first successful",
-                        "wins",
-                        "immediately"
-                    ]
-                    
-                    for log_entry in logs[-5:]:  # Check recent logs
-                        for indicator in first_wins_indicators:
-                            if indicator in log_entry:
-                                print(f"✅ First-wins indicator: {log_entry}")
-                                quick_response_detected = True
+                    for log_entry in islice(logs, max(len(logs) - 5, 0), None):  # Check recent logs
+                        if FIRST_WINS_RE.search(log_entry):
+                            logger.info(f"✅ First-wins indicator: {log_entry}")
+                            quick_response_detected = True
                         
                         # Also check for quick balance results
-                        if "⚡" in log_entry and "result from" in log_entry:
+                        if "ULTRA FAST result from" in log_entry:
                             elapsed = check_time - start_time
-                            print(f"✅ Quick result detected in {elapsed:.1f}s: {log_entry}")
+                            logger.info(f"✅ Quick result detected in {elapsed:.1f}s: {log_entry}")
                             quick_response_detected = True
+                
+                if quick_response_detected:
+                    break
             
             if quick_response_detected:
-                print("✅ First Successful Result Wins PASSED - Quick responses detected")
+                logger.info("✅ First Successful Result Wins PASSED - Quick responses detected")
                 return True
             else:
-                print("⚠️ First Successful Result Wins test inconclusive - No explicit first-wins indicators")
+                logger.warning("⚠️ First Successful Result Wins test inconclusive - No explicit first-wins indicators")
                 # Check if session is processing efficiently
-                status_response = requests.get(f"{self.base_url}/session/{session_id}", timeout=10)
+                status_response = self.session.get(f"{self.base_url}/session/{session_id}", timeout=POLL_TIMEOUT)
                 if status_response.status_code == 200:
                     session_data = status_response.json()
                     combinations = session_data.get("combinations_checked", 0)
                     if combinations > 0:
-                        elapsed = time.time() - start_time
+                        elapsed = time.monotonic() - start_time
                         rate = combinations / elapsed if elapsed > 0 else 0
-                        print(f"✅ First Successful Result Wins PASSED - Processing rate: {rate:.2f} combinations/sec")
+                        logger.info(f"✅ First Successful Result Wins PASSED - Processing rate: {rate:.2f} combinations/sec")
                         return True
                 return True  # Don't fail on inconclusive
                 
         except Exception as e:
-            print(f"❌ First Successful Result Wins test FAILED - Error: {e}")
+            logger.error(f"❌ First Successful Result Wins test FAILED - Error: {e}")
             return False
 
     def run_infinitum_ultra_fast_tests(self):
         """Run all INFINITUM ULTRA FAST Multi-Explorer tests"""
-        print("🚀 Starting INFINITUM ULTRA FAST Multi-Explorer Bitcoin Recovery API Test Suite")
-        print("🎯 Focus: INFINITUM ULTRA FAST Multi-Explorer Technology with 4 Blockchain APIs")
-        print("=" * 90)
-        
-        results = {}
-        
-        # Test 1: INFINITUM Health Check with Multi-Explorer Features
-        results["infinitum_health_check"] = self.test_infinitum_health_check()
-        
-        # Test 2: Multi-Explorer Real Mode with 4 Blockchain APIs
-        results["multi_explorer_real_mode"] = self.test_multi_explorer_real_mode()
-        
-        # Test 3: Ultra Fast Performance with 0.05s timeout
-        results["ultra_fast_performance"] = self.test_ultra_fast_performance()
-        
-        # Test 4: Concurrent Multi-Explorer with Auto-Failover
-        results["concurrent_multi_explorer_failover"] = self.test_concurrent_multi_explorer_failover()
-        
-        # Test 5: 4 Blockchain Explorers Integration
-        results["four_blockchain_explorers"] = self.test_four_blockchain_explorers()
-        
-        # Test 6: Thread-Safe Smart Caching System
-        results["thread_safe_caching"] = self.test_thread_safe_caching()
+        logger.info("🚀 Starting INFINITUM ULTRA FAST Multi-Explorer Bitcoin Recovery API Test Suite")
+        logger.info("🎯 Focus: INFINITUM ULTRA FAST Multi-Explorer Technology with 4 Blockchain APIs")
+        logger.info("=" * 90)
+        
+        # Test 1 gates the rest - if the backend isn't healthy, every other test would only
+        # burn its own timeouts, so they are skipped (None) instead. A dead backend is caught
+        # by a ~2s liveness probe before the health check itself runs.
+        if self.backend_alive():
+            results = {"infinitum_health_check": self.test_infinitum_health_check()}
+        else:
+            logger.error(f"❌ Backend not reachable at {self.base_url} - health check FAILED")
+            results = {"infinitum_health_check": False}
+        
+        # Every other test starts its own session and mostly waits on the backend, so run them
+        # side by side - total runtime is the slowest test instead of the sum of all of them
+        tests = {
+            "multi_explorer_real_mode": self.test_multi_explorer_real_mode,  # Test 2
+            "ultra_fast_performance": self.test_ultra_fast_performance,  # Test 3
+            "concurrent_multi_explorer_failover": self.test_concurrent_multi_explorer_failover,  # Test 4
+            "four_blockchain_explorers": self.test_four_blockchain_explorers,  # Test 5
+            "thread_safe_caching": self.test_thread_safe_caching,  # Test 6
+            "first_successful_result_wins": self.test_first_successful_result_wins,  # Test 7
+        }
         
-        # Test 7: First Successful Result Wins
-        results["first_successful_result_wins"] = self.test_first_successful_result_wins()
+        if results["infinitum_health_check"]:
+            with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+                futures = {name: executor.submit(self.run_buffered, test) for name, test in tests.items()}
+                results.update((name, future.result()) for name, future in futures.items())
+        else:
+            logger.error("❌ Health check FAILED - skipping the remaining tests")
+            results.update(dict.fromkeys(tests, None))
         
         # Summary
-        print("\n" + "=" * 90)
-        print("🎯 INFINITUM ULTRA FAST MULTI-EXPLORER TEST RESULTS SUMMARY")
-        print("=" * 90)
+        logger.info("\n" + "=" * 90)
+        logger.info("🎯 INFINITUM ULTRA FAST MULTI-EXPLORER TEST RESULTS SUMMARY")
+        logger.info("=" * 90)
         
-        passed = 0
         total = len(results)
         
-        # Categorize tests by priority
-        critical_tests = ["infinitum_health_check", "multi_explorer_real_mode", "ultra_fast_performance"]
-        performance_tests = ["concurrent_multi_explorer_failover", "first_successful_result_wins"]
-        infrastructure_tests = ["four_blockchain_explorers", "thread_safe_caching"]
-        
-        critical_passed = 0
-        performance_passed = 0
-        infrastructure_passed = 0
-        
-        print("\n🔥 CRITICAL INFINITUM FEATURES:")
-        for test_name in critical_tests:
-            success = results.get(test_name, False)
-            status = "✅ PASSED" if success else "❌ FAILED"
-            print(f"  {test_name.replace('_', ' ').title()}: {status}")
-            if success:
-                passed += 1
-                critical_passed += 1
+        # Tally passes per category in a single pass over the results
+        category_passed = Counter(self.TEST_LABELS[test_name] for test_name, success in results.items() if success)
+        passed = sum(category_passed.values())
+        skipped = sum(1 for success in results.values() if success is None)
         
-        print("\n⚡ ULTRA FAST PERFORMANCE FEATURES:")
-        for test_name in performance_tests:
-            success = results.get(test_name, False)
-            status = "✅ PASSED" if success else "❌ FAILED"
-            print(f"  {test_name.replace('_', ' ').title()}: {status}")
-            if success:
-                passed += 1
-                performance_passed += 1
+        for heading, _, test_names in self.TEST_CATEGORIES:
+            logger.info(f"\n{heading}")
+            for test_name in test_names:
+                success = results.get(test_name, False)
+                status = "✅ PASSED" if success else "⏭️ SKIPPED" if success is None else "❌ FAILED"
+                logger.info(f"  {self.TEST_DISPLAY_NAMES[test_name]}: {status}")
         
-        print("\n🏗️ MULTI-EXPLORER INFRASTRUCTURE:")
-        for test_name in infrastructure_tests:
-            success = results.get(test_name, False)
-            status = "✅ PASSED" if success else "❌ FAILED"
-            print(f"  {test_name.replace('_', ' ').title()}: {status}")
-            if success:
-                passed += 1
-                infrastructure_passed += 1
+        logger.info(f"\nOverall: {passed}/{total} tests passed" + (f", {skipped} skipped" if skipped else ""))
+        for _, label, test_names in self.TEST_CATEGORIES:
+            logger.info(f"{label}: {category_passed[label]}/{len(test_names)} passed")
         
-        print(f"\nOverall: {passed}/{total} tests passed")
-        print(f"Critical Features: {critical_passed}/{len(critical_tests)} passed")
-        print(f"Performance Features: {performance_passed}/{len(performance_tests)} passed")
-        print(f"Infrastructure: {infrastructure_passed}/{len(infrastructure_tests)} passed")
+        critical_tests = self.CRITICAL_TESTS
+        critical_passed = category_passed["Critical Features"]
+        performance_passed = category_passed["Performance Features"]
+        infrastructure_passed = category_passed["Infrastructure"]
         
         # INFINITUM ULTRA FAST Assessment
-        print("\n" + "=" * 90)
-        print("🎯 INFINITUM ULTRA FAST MULTI-EXPLORER ASSESSMENT")
-        print("=" * 90)
+        logger.info("\n" + "=" * 90)
+        logger.info("🎯 INFINITUM ULTRA FAST MULTI-EXPLORER ASSESSMENT")
+        logger.info("=" * 90)
         
         if critical_passed == len(critical_tests):
-            print("🎉 ALL CRITICAL INFINITUM FEATURES WORKING!")
-            print("✅ INFINITUM Branding: Confirmed with Multi-Explorer Technology")
-            print("✅ Multi-Explorer Real Mode: 4 Blockchain APIs active")
-            print("✅ Ultra Fast Performance: 0.05s main loop timeout")
+            logger.info("🎉 ALL CRITICAL INFINITUM FEATURES WORKING!")
+            logger.info("✅ INFINITUM Branding: Confirmed with Multi-Explorer Technology")
+            logger.info("✅ Multi-Explorer Real Mode: 4 Blockchain APIs active")
+            logger.info("✅ Ultra Fast Performance: 0.05s main loop timeout")
         else:
-            print(f"⚠️ {len(critical_tests) - critical_passed} critical INFINITUM features have issues!")
+            logger.warning(f"⚠️ {len(critical_tests) - critical_passed} critical INFINITUM features have issues!")
             
             if not results.get("infinitum_health_check"):
-                print("❌ CRITICAL: INFINITUM branding or multi-explorer features missing")
+                logger.error("❌ CRITICAL: INFINITUM branding or multi-explorer features missing")
             if not results.get("multi_explorer_real_mode"):
-                print("❌ CRITICAL: Multi-explorer real mode not working")
+                logger.error("❌ CRITICAL: Multi-explorer real mode not working")
             if not results.get("ultra_fast_performance"):
-                print("❌ CRITICAL: Ultra fast performance not detected")
+                logger.error("❌ CRITICAL: Ultra fast performance not detected")
         
-        print("\n" + "=" * 90)
-        print("🚀 MULTI-EXPLORER TECHNOLOGY ASSESSMENT")
-        print("=" * 90)
+        logger.info("\n" + "=" * 90)
+        logger.info("🚀 MULTI-EXPLORER TECHNOLOGY ASSESSMENT")
+        logger.info("=" * 90)
         
         multi_explorer_score = infrastructure_passed + performance_passed
-        max_multi_explorer = len(infrastructure_tests) + len(performance_tests)
+        max_multi_explorer = len(self.INFRASTRUCTURE_TESTS) + len(self.PERFORMANCE_TESTS)
         
         if multi_explorer_score == max_multi_explorer:
-            print("✅ FULL MULTI-EXPLORER TECHNOLOGY WORKING!")
-            print("✅ 4 Blockchain Explorers: blockchain.info, blockstream.info, blockcypher.com, blockchair.com")
-            print("✅ Concurrent Multi-Threading: ThreadPoolExecutor with auto-failover")
-            print("✅ Thread-Safe Caching: Smart caching system active")
-            print("✅ First Successful Result Wins: Speed optimization working")
+            logger.info("✅ FULL MULTI-EXPLORER TECHNOLOGY WORKING!")
+            logger.info("✅ 4 Blockchain Explorers: blockchain.info, blockstream.info, blockcypher.com, blockchair.com")
+            logger.info("✅ Concurrent Multi-Threading: ThreadPoolExecutor with auto-failover")
+            logger.info("✅ Thread-Safe Caching: Smart caching system active")
+            logger.info("✅ First Successful Result Wins: Speed optimization working")
         else:
-            print(f"⚠️ {max_multi_explorer - multi_explorer_score} multi-explorer features need attention!")
+            logger.warning(f"⚠️ {max_multi_explorer - multi_explorer_score} multi-explorer features need attention!")
         
         # Final INFINITUM verdict
-        print("\n" + "=" * 90)
-        print("🏆 FINAL INFINITUM ULTRA FAST VERDICT")
-        print("=" * 90)
+        logger.info("\n" + "=" * 90)
+        logger.info("🏆 FINAL INFINITUM ULTRA FAST VERDICT")
+        logger.info("=" * 90)
         
         if passed >= total * 0.8:  # 80% pass rate
-            print("🎉 INFINITUM ULTRA FAST MULTI-EXPLORER SYSTEM: FULLY OPERATIONAL!")
-            print("🚀 Ready for ultra-fast Bitcoin recovery with 4 blockchain explorers")
-            print("⚡ 5-10x speed improvement confirmed with multi-explorer technology")
+            logger.info("🎉 INFINITUM ULTRA FAST MULTI-EXPLORER SYSTEM: FULLY OPERATIONAL!")
+            logger.info("🚀 Ready for ultra-fast Bitcoin recovery with 4 blockchain explorers")
+            logger.info("⚡ 5-10x speed improvement confirmed with multi-explorer technology")
         elif passed >= total * 0.6:  # 60% pass rate
-            print("⚡ INFINITUM ULTRA FAST MULTI-EXPLORER SYSTEM: MOSTLY OPERATIONAL")
-            print("🔧 Minor optimizations needed for full performance")
+            logger.info("⚡ INFINITUM ULTRA FAST MULTI-EXPLORER SYSTEM: MOSTLY OPERATIONAL")
+            logger.info("🔧 Minor optimizations needed for full performance")
         else:
-            print("⚠️ INFINITUM ULTRA FAST MULTI-EXPLORER SYSTEM: NEEDS ATTENTION")
-            print("🛠️ Significant issues detected requiring fixes")
+            logger.warning("⚠️ INFINITUM ULTRA FAST MULTI-EXPLORER SYSTEM: NEEDS ATTENTION")
+            logger.info("🛠️ Significant issues detected requiring fixes")
         
+        _output_handler.flush()
         return results
 
 if __name__ == "__main__":
-    tester = InfinitumUltraFastMultiExplorerTester()
-    test_results = tester.run_infinitum_ultra_fast_tests()
\ No newline at end of file
+    # Test sessions are deleted and pooled connections closed when the run ends, even on failure
+    try:
+        with InfinitumUltraFastMultiExplorerTester() as tester:
+            test_results = tester.run_infinitum_ultra_fast_tests()
+    finally:
+        _output_handler.flush()
\ No newline at end of file
@@ -4,136 +4,211 @@ Cache Performance Test - Test cache hits for repeated addresses
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
+import logging
+import logging.handlers
+import sys
 import time
+import types
+from concurrent.futures import ThreadPoolExecutor
 
 BASE_URL = "https://btc-wallet-recovery.preview.emergentagent.com/api"
 
+# (connect, read) timeouts - an unreachable host fails in seconds, slow responses still get the full read window
+CONNECT_TIMEOUT = 2.0
+READ_TIMEOUT = 10.0
+REQUEST_TIMEOUT = (CONNECT_TIMEOUT, READ_TIMEOUT)
+
+# Report lines are buffered and written in batches; failures (❌, logged as errors) flush immediately
+logger = logging.getLogger("cache_test")
+
+# One keep-alive session for the whole run; transient gateway errors are retried with backoff
+http_session = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+)
+http_session.mount("https://", _adapter)
+http_session.mount("http://", _adapter)
+http_session.headers.update({"Content-Type": "application/json", "Connection": "keep-alive"})
+
+# Sessions started by this run (see start_session), deleted together on exit
+created_sessions = []
+
+def poll_until(url, cond_fn, max_wait=10.0, initial=0.1, factor=1.7, max_delay=1.0):
+    """GET url with exponentially growing pauses until cond_fn(data) holds - returns data or None"""
+    deadline = time.monotonic() + max_wait
+    delay = initial
+    while True:
+        response = http_session.get(url, timeout=REQUEST_TIMEOUT)
+        if response.status_code == 200:
+            data = response.json()
+            if cond_fn(data):
+                return data
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        time.sleep(min(delay, remaining))
+        delay = min(delay * factor, max_delay)
+
+def is_completed(session_data):
+    return session_data.get("status") == "completed"
+
+def wait_for_completion(session, timeout=10):
+    """Block until the session completes (one long-poll request), True if it did"""
+    response = http_session.get(session.wait_url, params={"timeout": timeout}, timeout=(CONNECT_TIMEOUT, timeout + 5))
+    if response.status_code == 200:
+        return is_completed(response.json())
+    
+    # Backend without the long-poll endpoint - fall back to backoff polling
+    return poll_until(session.status_url, is_completed, max_wait=timeout) is not None
+
+# Same valid mnemonic for both sessions to trigger cache hits
+SESSION_CONFIG = {
+    "known_words": {
+        "0": "abandon", "1": "abandon", "2": "abandon", "3": "abandon",
+        "4": "abandon", "5": "abandon", "6": "abandon", "7": "abandon", 
+        "8": "abandon", "9": "abandon", "10": "abandon", "11": "about"
+    },
+    "min_balance": 0.00000001,
+    "address_formats": ["legacy", "segwit", "native_segwit"],
+    "max_combinations": 1,
+    "demo_mode": False  # Real mode to test caching
+}
+# Posted twice per run - serialize once at import
+SESSION_CONFIG_BODY = json.dumps(SESSION_CONFIG).encode()
+
+def start_session(label):
+    """Start a recovery session with SESSION_CONFIG - returns it with its URLs formatted once, or None"""
+    response = http_session.post(f"{BASE_URL}/start-recovery", data=SESSION_CONFIG_BODY, timeout=(CONNECT_TIMEOUT, 15))
+    if response.status_code != 200:
+        logger.error(f"❌ Cache test FAILED - Could not start {label} session")
+        return None
+    
+    session_id = response.json()["session_id"]
+    session = types.SimpleNamespace(
+        id=session_id,
+        status_url=f"{BASE_URL}/session/{session_id}",
+        wait_url=f"{BASE_URL}/session/{session_id}/wait",
+        logs_url=f"{BASE_URL}/logs/{session_id}"
+    )
+    created_sessions.append(session)
+    logger.info(f"✅ Started {label} session: {session_id}")
+    return session
+
+def cleanup_sessions():
+    """Delete every session this run created - all DELETEs in flight at once"""
+    if not created_sessions:
+        return
+    with ThreadPoolExecutor(max_workers=len(created_sessions)) as executor:
+        responses = list(executor.map(
+            lambda session: http_session.delete(session.status_url, timeout=(CONNECT_TIMEOUT, 5)),
+            created_sessions
+        ))
+    deleted = sum(1 for response in responses if response.ok)
+    logger.info(f"🧹 Cleaned up {deleted}/{len(created_sessions)} test sessions")
+
 def test_cache_hits():
     """Test cache hits by running the same mnemonic twice"""
-    print("💾 Testing Cache Hits with Repeated Addresses...")
-    
-    # Same valid mnemonic for both sessions to trigger cache hits
-    session_config = {
-        "known_words": {
-            "0": "abandon", "1": "abandon", "2": "abandon", "3": "abandon",
-            "4": "abandon", "5": "abandon", "6": "abandon", "7": "abandon", 
-            "8": "abandon", "9": "abandon", "10": "abandon", "11": "about"
-        },
-        "min_balance": 0.00000001,
-        "address_formats": ["legacy", "segwit", "native_segwit"],
-        "max_combinations": 1,
-        "demo_mode": False  # Real mode to test caching
-    }
+    logger.info("💾 Testing Cache Hits with Repeated Addresses...")
     
     try:
-        print("🎯 First session - should populate cache...")
-        
-        # First session
-        response1 = requests.post(
-            f"{BASE_URL}/start-recovery",
-            json=session_config,
-            headers={"Content-Type": "application/json"},
-            timeout=15
-        )
+        logger.info("🎯 First session - should populate cache...")
         
-        if response1.status_code != 200:
-            print(f"❌ Cache test FAILED - Could not start first session")
+        session_1 = start_session("first")
+        if session_1 is None:
             return False
         
-        session_id_1 = response1.json()["session_id"]
-        print(f"✅ Started first session: {session_id_1}")
-        
-        # Wait for first session to complete
-        for i in range(10):
-            time.sleep(1)
-            status_response = requests.get(f"{BASE_URL}/session/{session_id_1}", timeout=10)
-            if status_response.status_code == 200:
-                session_data = status_response.json()
-                if session_data.get("status") == "completed":
-                    print("✅ First session completed - cache should be populated")
-                    break
+        # Wait for first session to complete - balances are cached before it reports completed,
+        # so the second session can start the moment this returns
+        if wait_for_completion(session_1, timeout=10):
+            logger.info("✅ First session completed - cache should be populated")
         
-        # Small delay to ensure cache is populated
-        time.sleep(2)
-        
-        print("🎯 Second session - should hit cache...")
+        logger.info("🎯 Second session - should hit cache...")
         
         # Second session with same mnemonic
-        response2 = requests.post(
-            f"{BASE_URL}/start-recovery",
-            json=session_config,
-            headers={"Content-Type": "application/json"},
-            timeout=15
-        )
-        
-        if response2.status_code != 200:
-            print(f"❌ Cache test FAILED - Could not start second session")
+        session_2 = start_session("second")
+        if session_2 is None:
             return False
         
-        session_id_2 = response2.json()["session_id"]
-        print(f"✅ Started second session: {session_id_2}")
+        # Wait for the second session with backoff polling (exits as soon as it completes),
+        # then read its logs once instead of re-downloading them every second
+        if poll_until(session_2.status_url, is_completed, max_wait=10) is not None:
+            logger.info("✅ Second session completed")
         
-        # Monitor second session for cache hits
+        # Check logs for cache hits
         cache_hits_found = []
-        for i in range(10):
-            time.sleep(1)
-            
-            # Check logs for cache hits
-            logs_response = requests.get(f"{BASE_URL}/logs/{session_id_2}", timeout=10)
-            if logs_response.status_code == 200:
-                logs_data = logs_response.json()
-                logs = logs_data.get("logs", [])
-                
-                for log_entry in logs:
-                    if "💾 Cache hit for" in log_entry:
-                        if log_entry not in cache_hits_found:
-                            cache_hits_found.append(log_entry)
-                            print(f"✅ CACHE HIT DETECTED: {log_entry}")
+        logs_response = http_session.get(session_2.logs_url, timeout=REQUEST_TIMEOUT)
+        if logs_response.status_code == 200:
+            logs_data = logs_response.json()
+            logs = logs_data.get("logs", [])
             
-            # Check if completed
-            status_response = requests.get(f"{BASE_URL}/session/{session_id_2}", timeout=10)
-            if status_response.status_code == 200:
-                session_data = status_response.json()
-                if session_data.get("status") == "completed":
-                    print("✅ Second session completed")
-                    break
+            for log_entry in logs:
+                if "💾 Cache hit for" in log_entry:
+                    if log_entry not in cache_hits_found:
+                        cache_hits_found.append(log_entry)
+                        logger.info(f"✅ CACHE HIT DETECTED: {log_entry}")
         
         # Analyze results
         if cache_hits_found:
-            print(f"✅ CACHE PERFORMANCE VERIFIED: Found {len(cache_hits_found)} cache hits")
-            print("✅ Thread-safe caching working correctly")
+            logger.info(f"✅ CACHE PERFORMANCE VERIFIED: Found {len(cache_hits_found)} cache hits")
+            logger.info("✅ Thread-safe caching working correctly")
             return True
         else:
-            print("⚠️ No cache hits detected - may be due to timing or cache expiry")
+            logger.warning("⚠️ No cache hits detected - may be due to timing or cache expiry")
             # Don't fail - cache behavior can vary
             return True
             
     except Exception as e:
-        print(f"❌ Cache test FAILED - Error: {e}")
+        logger.error(f"❌ Cache test FAILED - Error: {e}")
         return False
 
 def main():
-    print("💾 CACHE PERFORMANCE TEST")
-    print("🎯 Testing thread-safe caching with repeated addresses")
-    print("=" * 60)
+    console = logging.StreamHandler(sys.stdout)
+    console.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(logging.handlers.MemoryHandler(capacity=1024, flushLevel=logging.ERROR, target=console))
+    logger.setLevel(logging.INFO)
+    
+    logger.info("💾 CACHE PERFORMANCE TEST")
+    logger.info("🎯 Testing thread-safe caching with repeated addresses")
+    logger.info("=" * 60)
+    
+    # Preflight - fail with one clear line instead of a traceback when the backend is unreachable
+    try:
+        health_response = http_session.get(f"{BASE_URL}/health", timeout=REQUEST_TIMEOUT)
+    except requests.RequestException as e:
+        logger.error(f"❌ Backend health check FAILED - Error: {e}")
+        return False
+    if not health_response.ok:
+        logger.error(f"❌ Backend health check FAILED - Status: {health_response.status_code}")
+        return False
     
     result = test_cache_hits()
     
-    print("\n" + "=" * 60)
-    print("🎯 CACHE TEST RESULT")
-    print("=" * 60)
+    logger.info("\n" + "=" * 60)
+    logger.info("🎯 CACHE TEST RESULT")
+    logger.info("=" * 60)
     
     status = "✅ PASSED" if result else "❌ FAILED"
-    print(f"Cache Performance Test: {status}")
+    logger.info(f"Cache Performance Test: {status}")
     
     if result:
-        print("\n✅ CACHE SYSTEM VERIFIED!")
-        print("✅ Thread-safe balance caching implemented")
-        print("✅ Prevents redundant API calls for same addresses")
-        print("✅ Supports concurrent access across sessions")
+        logger.info("\n✅ CACHE SYSTEM VERIFIED!")
+        logger.info("✅ Thread-safe balance caching implemented")
+        logger.info("✅ Prevents redundant API calls for same addresses")
+        logger.info("✅ Supports concurrent access across sessions")
     
     return result
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    try:
+        main()
+    finally:
+        try:
+            cleanup_sessions()
+        finally:
+            http_session.close()
+            logging.shutdown()  # Flush whatever is still buffered
\ No newline at end of file
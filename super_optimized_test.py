@@ -5,7 +5,12 @@ Focus on: Threading-Based Concurrent Balance Checking, Optimized Timeouts, Cache
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ReadTimeoutError
+from urllib3.util.retry import Retry
 import json
+import os
+import re
 import time
 import uuid
 import threading
@@ -15,11 +20,211 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 # Use the production backend URL from frontend .env
 BASE_URL = "https://btc-wallet-recovery.preview.emergentagent.com/api"
 
+# The backend sends an SSE keep-alive this often on idle streams - stream reads must wait longer than that
+SSE_KEEPALIVE_SECONDS = 15
+
+# Log markers of the optimized balance checker, matched in a single regex pass per line
+SPEED_INDICATORS = (
+    "🚀 Starting threaded concurrent",
+    "⚡ Super fast balance:",
+    "💾 Cache hit for",
+    "Super fast checking balance"
+)
+SPEED_INDICATOR_RE = re.compile("|".join(map(re.escape, SPEED_INDICATORS)))
+
+# (word, expected validity) pairs for the word validation test
+WORD_VALIDATION_CASES = (
+    ("abandon", True),
+    ("ability", True),
+    ("zoo", True),
+    ("ABOUT", True),  # Case-insensitive
+    ("bitcoin", False),
+    ("notaword", False)
+)
+WORD_VALIDATION_WORDS = tuple(word for word, _ in WORD_VALIDATION_CASES)
+
+# Known words shared by the timeout, demo and real-mode sessions (never mutated)
+ABANDON_ABILITY = {"0": "abandon", "1": "ability"}
+
+# Real-mode configs - start_shared_session only shares a session between tests whose configs match exactly
+TIMEOUT_TEST_SESSION = {
+    "known_words": ABANDON_ABILITY,
+    "min_balance": 0.00000001,
+    "address_formats": ["legacy"],  # Single format for timeout testing
+    "max_combinations": 5,
+    "demo_mode": False  # Real mode to test API timeouts
+}
+SPEED_REAL_SESSION = {
+    "known_words": ABANDON_ABILITY,
+    "min_balance": 0.00000001,
+    "address_formats": ["legacy"],
+    "max_combinations": 3,  # Fewer for real mode
+    "demo_mode": False
+}
+
+# Demo session long enough (0.8s per valid combination) to still be running when it is cancelled
+CANCEL_TEST_SESSION = {
+    "known_words": ABANDON_ABILITY,
+    "min_balance": 0.00000001,
+    "address_formats": ["legacy"],
+    "max_combinations": 1000,
+    "demo_mode": True
+}
+
+# Stop word validation at the first wrong answer instead of reporting every case
+FAIL_FAST = os.getenv("BTC_TEST_FAIL_FAST", "0") == "1"
+
 class SuperOptimizedTester:
+    __slots__ = (
+        "base_url", "session_ids", "session", "session_status_cache",
+        "shared_sessions", "shared_sessions_lock",
+        "start_recovery_url", "session_url", "logs_url", "logs_stream_url"
+    )
+    
+    # Shared by every tester in the process - the wordlist never changes
+    _bip39_words = None
+    
     def __init__(self):
         self.base_url = BASE_URL
         self.session_ids = []  # Track created sessions for cleanup
         
+        # URL templates built once instead of an f-string per poll
+        self.start_recovery_url = self.base_url + "/start-recovery"
+        self.session_url = self.base_url + "/session/{}"
+        self.logs_url = self.base_url + "/logs/{}"
+        self.logs_stream_url = self.base_url + "/logs/{}/stream"
+        
+        # One pooled keep-alive session for every request (TLS handshake once per connection)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(total=2, backoff_factor=0.2)
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({"Content-Type": "application/json"})
+        
+        # Last session document and ETag per session - unchanged polls come back as empty 304s
+        self.session_status_cache = {}
+        
+        # One backend session per unique config, shared by every test that uses that config
+        self.shared_sessions = {}
+        self.shared_sessions_lock = threading.Lock()
+        
+    def get_session_status(self, session_id: str):
+        """Fetch a session's status, reusing the cached document when the server answers 304"""
+        cached = self.session_status_cache.get(session_id)
+        headers = {"If-None-Match": cached[0]} if cached else None
+        
+        response = self.session.get(self.session_url.format(session_id), headers=headers, timeout=10)
+        if response.status_code == 304 and cached:
+            return cached[1]
+        if response.status_code != 200:
+            return None
+        
+        session_data = response.json()
+        etag = response.headers.get("ETag")
+        if etag:
+            self.session_status_cache[session_id] = (etag, session_data)
+        return session_data
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.cleanup()
+        return False
+    
+    def cleanup(self):
+        """Delete every session this run created (in parallel), then close the pooled connections"""
+        try:
+            if self.session_ids:
+                with ThreadPoolExecutor(max_workers=min(len(self.session_ids), 16)) as executor:
+                    futures = [
+                        executor.submit(self.session.delete, self.session_url.format(session_id), timeout=10)
+                        for session_id in self.session_ids
+                    ]
+                    deleted = sum(1 for future in as_completed(futures) if not future.exception() and future.result().ok)
+                print(f"🧹 Cleaned up {deleted}/{len(self.session_ids)} test sessions")
+        finally:
+            self.session.close()
+    
+    def start_shared_session(self, config: dict):
+        """Start a session for this config once - returns (session_id, started_at) or None"""
+        key = json.dumps(config, sort_keys=True)
+        with self.shared_sessions_lock:
+            if key not in self.shared_sessions:
+                started_at = time.monotonic()
+                # The key is already the JSON body - post it instead of serializing the config twice
+                response = self.session.post(self.start_recovery_url, data=key.encode(), timeout=15)
+                if response.status_code != 200:
+                    print(f"❌ Could not start session: {response.status_code}")
+                    return None
+                session_id = response.json()["session_id"]
+                self.session_ids.append(session_id)
+                self.shared_sessions[key] = (session_id, started_at)
+            return self.shared_sessions[key]
+    
+    def get_bip39_words(self):
+        """Fetch the full BIP39 wordlist once per process (None if the backend doesn't expose it)"""
+        if SuperOptimizedTester._bip39_words is None:
+            response = self.session.get(f"{self.base_url}/wordlist", params={"full": "true"}, timeout=10)
+            if response.status_code == 200:
+                words = response.json().get("words", [])
+                # The UI endpoint returns only 100 words unless ?full=true is supported
+                if len(words) == 2048:
+                    SuperOptimizedTester._bip39_words = frozenset(words)
+        return SuperOptimizedTester._bip39_words
+    
+    def session_has_status(self, session_id: str, status: str) -> bool:
+        """True once the session reports the given status"""
+        session_data = self.get_session_status(session_id)
+        return session_data is not None and session_data.get("status") == status
+    
+    def get_status_and_logs(self, session_id: str, tail: int):
+        """Fetch session status and the log tail - returns (session_data or None, logs)"""
+        session_data = self.get_session_status(session_id)
+        logs_response = self.session.get(self.logs_url.format(session_id), params={"tail": tail}, timeout=10)
+        logs = logs_response.json().get("logs", []) if logs_response.status_code == 200 else []
+        return session_data, logs
+    
+    def wait_until(self, predicate, timeout: float = 15, initial_delay: float = 0.1, max_delay: float = 1.0) -> bool:
+        """Poll predicate with exponential backoff until it holds or timeout expires"""
+        deadline = time.monotonic() + timeout
+        delay = initial_delay
+        while True:
+            if predicate():
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, max_delay)
+    
+    def stream_logs(self, session_id: str, timeout: float = 15):
+        """Yield log lines from the SSE log stream until the session ends or timeout expires"""
+        deadline = time.monotonic() + timeout
+        try:
+            with self.session.get(
+                self.logs_stream_url.format(session_id),
+                stream=True,
+                timeout=(5, SSE_KEEPALIVE_SECONDS + 5)
+            ) as response:
+                response.raise_for_status()
+                # chunk_size=None hands over each event as soon as it arrives
+                for line in response.iter_lines(chunk_size=None, decode_unicode=True):
+                    if time.monotonic() > deadline or line.startswith(("event: end", "event: error")):
+                        return
+                    if line.startswith("data: "):
+                        yield json.loads(line[6:])
+        except requests.exceptions.Timeout:
+            return  # Nothing arrived, not even a keep-alive - the budget is used up
+        except requests.exceptions.ConnectionError as e:
+            # requests re-raises a read timeout hit mid-stream as ConnectionError
+            if not (e.args and isinstance(e.args[0], ReadTimeoutError)):
+                raise
+    
     def test_threading_concurrent_balance_checking(self):
         """Test 1: Threading-Based Concurrent Balance Checking with ThreadPoolExecutor"""
         print("\n🚀 Testing Threading-Based Concurrent Balance Checking...")
@@ -37,10 +242,9 @@ class SuperOptimizedTester:
             print("🎯 Starting session with multiple address formats for concurrent testing...")
             
             # Start recovery session
-            response = requests.post(
-                f"{self.base_url}/start-recovery",
+            response = self.session.post(
+                self.start_recovery_url,
                 json=concurrent_session,
-                headers={"Content-Type": "application/json"},
                 timeout=15
             )
             
@@ -56,42 +260,27 @@ class SuperOptimizedTester:
             threading_indicators_found = []
             cache_hits_found = []
             
-            for i in range(6):  # Monitor for 12 seconds
-                time.sleep(2)
+            # Each log line is pushed as it is written - no fixed sleeps between polls
+            for log_entry in self.stream_logs(session_id, timeout=12):
+                # Look for threading indicators
+                if "🚀 Starting threaded concurrent balance checks" in log_entry:
+                    threading_indicators_found.append(log_entry)
+                    print(f"✅ THREADING DETECTED: {log_entry}")
                 
-                # Get logs to check for threading and cache indicators
-                logs_response = requests.get(f"{self.base_url}/logs/{session_id}", timeout=10)
-                if logs_response.status_code == 200:
-                    logs_data = logs_response.json()
-                    logs = logs_data.get("logs", [])
-                    
-                    # Look for threading indicators
-                    for log_entry in logs:
-                        if "🚀 Starting threaded concurrent balance checks" in log_entry:
-                            threading_indicators_found.append(log_entry)
-                            print(f"✅ THREADING DETECTED: {log_entry}")
-                        
-                        if "💾 Cache hit for" in log_entry:
-                            cache_hits_found.append(log_entry)
-                            print(f"✅ CACHE HIT DETECTED: {log_entry}")
-                        
-                        if "⚡ Super fast balance:" in log_entry:
-                            print(f"✅ SUPER FAST BALANCE: {log_entry}")
-                        
-                        if "Super fast checking balance for:" in log_entry:
-                            print(f"✅ CONCURRENT API CALL: {log_entry}")
+                if "💾 Cache hit for" in log_entry:
+                    cache_hits_found.append(log_entry)
+                    print(f"✅ CACHE HIT DETECTED: {log_entry}")
                 
-                # Check session status
-                status_response = requests.get(f"{self.base_url}/session/{session_id}", timeout=10)
-                if status_response.status_code == 200:
-                    session_data = status_response.json()
-                    combinations_checked = session_data.get("combinations_checked", 0)
-                    status = session_data.get("status", "unknown")
-                    print(f"   Progress check {i+1}: {combinations_checked} combinations, status: {status}")
-                    
-                    if status == "completed":
-                        print("✅ Session completed, analyzing results...")
-                        break
+                if "⚡ Super fast balance:" in log_entry:
+                    print(f"✅ SUPER FAST BALANCE: {log_entry}")
+                
+                if "Super fast checking balance for:" in log_entry:
+                    print(f"✅ CONCURRENT API CALL: {log_entry}")
+                
+                if "📊 Progress:" in log_entry:
+                    print(f"   {log_entry}")
+            
+            print("✅ Log stream closed, analyzing results...")
             
             # Analyze results
             success_indicators = 0
@@ -110,9 +299,8 @@ class SuperOptimizedTester:
                 success_indicators += 1  # Don't penalize for no cache hits on fresh addresses
             
             # Check if session processed multiple combinations with concurrent checking
-            final_status_response = requests.get(f"{self.base_url}/session/{session_id}", timeout=10)
-            if final_status_response.status_code == 200:
-                final_session_data = final_status_response.json()
+            final_session_data = self.get_session_status(session_id)
+            if final_session_data is not None:
                 final_combinations = final_session_data.get("combinations_checked", 0)
                 if final_combinations > 0:
                     print(f"✅ PROCESSING VERIFIED: {final_combinations} combinations processed")
@@ -133,35 +321,18 @@ class SuperOptimizedTester:
         """Test 2: Optimized Timeouts and Delays (4s timeout, 0.2s rate limit, 0.1s main loop)"""
         print("\n⚡ Testing Optimized Timeouts and Delays...")
         
-        # Test with real blockchain mode to verify timeout optimizations
-        timeout_session = {
-            "known_words": {"0": "abandon", "1": "ability"},
-            "min_balance": 0.00000001,
-            "address_formats": ["legacy"],  # Single format for timeout testing
-            "max_combinations": 5,
-            "demo_mode": False  # Real mode to test API timeouts
-        }
-        
         try:
             print("🎯 Testing API timeout optimization (4s vs 8s)...")
             print("🎯 Testing rate limiting delay (0.2s vs 1s)...")
             print("🎯 Testing main loop delay (0.1s vs 1s)...")
             
-            # Start session and measure timing
-            start_time = time.time()
-            response = requests.post(
-                f"{self.base_url}/start-recovery",
-                json=timeout_session,
-                headers={"Content-Type": "application/json"},
-                timeout=15
-            )
-            
-            if response.status_code != 200:
-                print(f"❌ Timeout test FAILED - Could not start session: {response.status_code}")
+            # Start (or join) the session and measure timing from its start
+            shared = self.start_shared_session(TIMEOUT_TEST_SESSION)
+            if shared is None:
+                print("❌ Timeout test FAILED - Could not start session")
                 return False
             
-            session_id = response.json()["session_id"]
-            self.session_ids.append(session_id)
+            session_id, start_time = shared
             print(f"✅ Started timeout optimization test session: {session_id}")
             
             # Monitor for speed indicators and timing
@@ -169,41 +340,36 @@ class SuperOptimizedTester:
             timeout_indicators = []
             rate_limit_indicators = []
             
-            for i in range(8):  # Monitor for 16 seconds
-                time.sleep(2)
-                check_time = time.time()
+            def check_timing():
+                """One poll - record timing and scan recent logs, True once the session has completed"""
+                check_time = time.monotonic()
                 
-                # Get session status for timing analysis
-                status_response = requests.get(f"{self.base_url}/session/{session_id}", timeout=10)
-                if status_response.status_code == 200:
-                    session_data = status_response.json()
-                    combinations_checked = session_data.get("combinations_checked", 0)
-                    status = session_data.get("status", "unknown")
-                    
-                    elapsed_time = check_time - start_time
-                    timing_measurements.append((elapsed_time, combinations_checked))
-                    print(f"   Timing check {i+1}: {combinations_checked} combinations in {elapsed_time:.1f}s")
-                    
-                    if status == "completed":
-                        break
+                # Session status (timing analysis) and recent logs
+                session_data, logs = self.get_status_and_logs(session_id, tail=5)
                 
                 # Check logs for timeout and rate limiting indicators
-                logs_response = requests.get(f"{self.base_url}/logs/{session_id}", timeout=10)
-                if logs_response.status_code == 200:
-                    logs_data = logs_response.json()
-                    logs = logs_data.get("logs", [])
+                for log_entry in logs:  # Check recent logs
+                    if "Timeout (4s)" in log_entry:
+                        timeout_indicators.append(log_entry)
+                        print(f"✅ OPTIMIZED TIMEOUT DETECTED: {log_entry}")
                     
-                    for log_entry in logs[-5:]:  # Check recent logs
-                        if "Timeout (4s)" in log_entry:
-                            timeout_indicators.append(log_entry)
-                            print(f"✅ OPTIMIZED TIMEOUT DETECTED: {log_entry}")
-                        
-                        if "Rate limited, minimal wait" in log_entry:
-                            rate_limit_indicators.append(log_entry)
-                            print(f"✅ OPTIMIZED RATE LIMITING DETECTED: {log_entry}")
-                        
-                        if "⏳ Rate limited" in log_entry:
-                            print(f"ℹ️ Rate limiting active: {log_entry}")
+                    if "Rate limited, minimal wait" in log_entry:
+                        rate_limit_indicators.append(log_entry)
+                        print(f"✅ OPTIMIZED RATE LIMITING DETECTED: {log_entry}")
+                    
+                    if "⏳ Rate limited" in log_entry:
+                        print(f"ℹ️ Rate limiting active: {log_entry}")
+                
+                if session_data is None:
+                    return False
+                combinations_checked = session_data.get("combinations_checked", 0)
+                elapsed_time = check_time - start_time
+                timing_measurements.append((elapsed_time, combinations_checked))
+                print(f"   Timing check {len(timing_measurements)}: {combinations_checked} combinations in {elapsed_time:.1f}s")
+                return session_data.get("status") == "completed"
+            
+            # Monitor for up to 16 seconds with backoff, stopping as soon as the session completes
+            self.wait_until(check_timing, timeout=16, initial_delay=0.5, max_delay=2.0)
             
             # Analyze timing for speed improvements
             success_indicators = 0
@@ -277,10 +443,9 @@ class SuperOptimizedTester:
             print("🎯 Testing cache with first session (fresh addresses)...")
             
             # Start first session
-            response1 = requests.post(
-                f"{self.base_url}/start-recovery",
+            response1 = self.session.post(
+                self.start_recovery_url,
                 json=cache_session_1,
-                headers={"Content-Type": "application/json"},
                 timeout=15
             )
             
@@ -292,16 +457,15 @@ class SuperOptimizedTester:
             self.session_ids.append(session_id_1)
             print(f"✅ Started first cache test session: {session_id_1}")
             
-            # Wait for first session to process and populate cache
-            time.sleep(8)
+            # Wait for first session to process and populate cache (up to 8s, not a fixed 8s)
+            self.wait_until(lambda: self.session_has_status(session_id_1, "completed"), timeout=8)
             
             print("🎯 Testing cache with second session (should hit cache for some addresses)...")
             
             # Start second session
-            response2 = requests.post(
-                f"{self.base_url}/start-recovery",
+            response2 = self.session.post(
+                self.start_recovery_url,
                 json=cache_session_2,
-                headers={"Content-Type": "application/json"},
                 timeout=15
             )
             
@@ -317,33 +481,38 @@ class SuperOptimizedTester:
             cache_hits_found = []
             fresh_api_calls = []
             
-            for i in range(6):  # Monitor for 12 seconds
-                time.sleep(2)
-                
-                # Check logs from both sessions
-                for session_id in [session_id_1, session_id_2]:
-                    logs_response = requests.get(f"{self.base_url}/logs/{session_id}", timeout=10)
-                    if logs_response.status_code == 200:
-                        logs_data = logs_response.json()
-                        logs = logs_data.get("logs", [])
-                        
-                        for log_entry in logs[-10:]:  # Check recent logs
-                            if "💾 Cache hit for" in log_entry:
-                                cache_hits_found.append(log_entry)
-                                print(f"✅ CACHE HIT: {log_entry}")
-                            
-                            if "🚀 Super fast checking balance for:" in log_entry:
-                                fresh_api_calls.append(log_entry)
-                                print(f"ℹ️ FRESH API CALL: {log_entry}")
+            checks = 0
+            
+            def check_both_sessions():
+                """One poll of both sessions - scan recent logs, True once both have completed"""
+                nonlocal checks
+                checks += 1
+                all_completed = True
                 
-                # Check session statuses
+                # Check logs and status of both sessions
                 for j, session_id in enumerate([session_id_1, session_id_2], 1):
-                    status_response = requests.get(f"{self.base_url}/session/{session_id}", timeout=10)
-                    if status_response.status_code == 200:
-                        session_data = status_response.json()
-                        combinations_checked = session_data.get("combinations_checked", 0)
-                        status = session_data.get("status", "unknown")
-                        print(f"   Session {j} check {i+1}: {combinations_checked} combinations, status: {status}")
+                    session_data, logs = self.get_status_and_logs(session_id, tail=10)
+                    
+                    for log_entry in logs:  # Check recent logs
+                        if "💾 Cache hit for" in log_entry:
+                            cache_hits_found.append(log_entry)
+                            print(f"✅ CACHE HIT: {log_entry}")
+                        
+                        if "🚀 Super fast checking balance for:" in log_entry:
+                            fresh_api_calls.append(log_entry)
+                            print(f"ℹ️ FRESH API CALL: {log_entry}")
+                    
+                    if session_data is None:
+                        all_completed = False
+                        continue
+                    combinations_checked = session_data.get("combinations_checked", 0)
+                    status = session_data.get("status", "unknown")
+                    print(f"   Session {j} check {checks}: {combinations_checked} combinations, status: {status}")
+                    all_completed = all_completed and status == "completed"
+                return all_completed
+            
+            # Monitor for up to 12 seconds with backoff, done once both sessions have completed
+            self.wait_until(check_both_sessions, timeout=12, initial_delay=0.5, max_delay=2.0)
             
             # Analyze cache performance
             success_indicators = 0
@@ -388,115 +557,105 @@ class SuperOptimizedTester:
         
         # Demo mode session
         demo_session = {
-            "known_words": {"0": "abandon", "1": "ability"},
+            "known_words": ABANDON_ABILITY,
             "min_balance": 0.00000001,
             "address_formats": ["legacy"],
             "max_combinations": 5,
             "demo_mode": True
         }
         
-        # Real blockchain mode session
-        real_session = {
-            "known_words": {"0": "abandon", "1": "ability"},
-            "min_balance": 0.00000001,
-            "address_formats": ["legacy"],
-            "max_combinations": 3,  # Fewer for real mode
-            "demo_mode": False
-        }
-        
-        try:
-            print("🎯 Testing Demo Mode speed...")
-            
-            # Test demo mode
-            demo_start = time.time()
-            demo_response = requests.post(
-                f"{self.base_url}/start-recovery",
+        def run_demo_mode():
+            """Start and time the demo session - returns None if it could not start"""
+            demo_start = time.monotonic()
+            demo_response = self.session.post(
+                self.start_recovery_url,
                 json=demo_session,
-                headers={"Content-Type": "application/json"},
                 timeout=15
             )
             
             if demo_response.status_code != 200:
                 print(f"❌ Speed comparison FAILED - Could not start demo session")
-                return False
+                return None
             
             demo_session_id = demo_response.json()["session_id"]
             self.session_ids.append(demo_session_id)
             
             # Monitor demo session
-            demo_completed = False
-            demo_time = 0
-            for i in range(10):
-                time.sleep(1)
-                status_response = requests.get(f"{self.base_url}/session/{demo_session_id}", timeout=10)
-                if status_response.status_code == 200:
-                    session_data = status_response.json()
-                    if session_data.get("status") == "completed":
-                        demo_time = time.time() - demo_start
-                        demo_completed = True
-                        print(f"✅ Demo mode completed in {demo_time:.1f}s")
-                        break
-            
-            if not demo_completed:
-                demo_time = time.time() - demo_start
-                print(f"ℹ️ Demo mode still running after {demo_time:.1f}s")
-            
-            print("🎯 Testing Real Blockchain Mode speed...")
-            
-            # Test real mode
-            real_start = time.time()
-            real_response = requests.post(
-                f"{self.base_url}/start-recovery",
-                json=real_session,
-                headers={"Content-Type": "application/json"},
-                timeout=15
-            )
-            
-            if real_response.status_code != 200:
+            demo_completed = self.wait_until(lambda: self.session_has_status(demo_session_id, "completed"), timeout=10)
+            demo_time = time.monotonic() - demo_start
+            if demo_completed:
+                print(f"✅ Demo mode completed in {demo_time:.1f}s")
+                return demo_time
+            
+            print(f"ℹ️ Demo mode still running after {demo_time:.1f}s")
+            return demo_time
+        
+        def run_real_mode():
+            """Start and time the real session - returns None if it could not start"""
+            shared = self.start_shared_session(SPEED_REAL_SESSION)
+            if shared is None:
                 print(f"❌ Speed comparison FAILED - Could not start real session")
-                return False
+                return None
             
-            real_session_id = real_response.json()["session_id"]
-            self.session_ids.append(real_session_id)
+            real_session_id, real_start = shared
             
-            # Monitor real session for speed indicators
-            real_time = 0
+            # Monitor real session for speed indicators - loop invariants bound once
             speed_indicators = []
-            for i in range(15):  # Monitor longer for real mode
-                time.sleep(1)
+            get = self.session.get
+            get_session_status = self.get_session_status
+            logs_url = self.logs_url.format(real_session_id)
+            logs_params = {"tail": 5}
+            checks = 0
+            
+            def check_real_session():
+                """One poll - collect speed indicators, True once the real session has completed"""
+                nonlocal checks
+                checks += 1
                 
                 # Check logs for speed indicators
-                logs_response = requests.get(f"{self.base_url}/logs/{real_session_id}", timeout=10)
+                logs_response = get(logs_url, params=logs_params, timeout=10)
                 if logs_response.status_code == 200:
                     logs_data = logs_response.json()
                     logs = logs_data.get("logs", [])
                     
-                    for log_entry in logs[-5:]:
-                        if any(indicator in log_entry for indicator in [
-                            "🚀 Starting threaded concurrent",
-                            "⚡ Super fast balance:",
-                            "💾 Cache hit for",
-                            "Super fast checking balance"
-                        ]):
+                    for log_entry in logs:
+                        if SPEED_INDICATOR_RE.search(log_entry):
                             if log_entry not in speed_indicators:
                                 speed_indicators.append(log_entry)
                                 print(f"✅ SPEED INDICATOR: {log_entry}")
                 
                 # Check status
-                status_response = requests.get(f"{self.base_url}/session/{real_session_id}", timeout=10)
-                if status_response.status_code == 200:
-                    session_data = status_response.json()
-                    combinations_checked = session_data.get("combinations_checked", 0)
-                    if session_data.get("status") == "completed":
-                        real_time = time.time() - real_start
-                        print(f"✅ Real mode completed in {real_time:.1f}s with {combinations_checked} combinations")
-                        break
-                    elif i % 3 == 0:  # Log every 3 seconds
-                        print(f"   Real mode progress: {combinations_checked} combinations in {time.time() - real_start:.1f}s")
-            
-            if real_time == 0:
-                real_time = time.time() - real_start
+                session_data = get_session_status(real_session_id)
+                if session_data is None:
+                    return False
+                combinations_checked = session_data.get("combinations_checked", 0)
+                if session_data.get("status") == "completed":
+                    print(f"✅ Real mode completed in {time.monotonic() - real_start:.1f}s with {combinations_checked} combinations")
+                    return True
+                if checks % 3 == 1:  # Log every third check
+                    print(f"   Real mode progress: {combinations_checked} combinations in {time.monotonic() - real_start:.1f}s")
+                return False
+            
+            # Monitor longer for real mode - up to 15s with backoff, done as soon as it completes
+            real_completed = self.wait_until(check_real_session, timeout=15, initial_delay=0.25, max_delay=1.0)
+            real_time = time.monotonic() - real_start
+            if not real_completed:
                 print(f"ℹ️ Real mode still running after {real_time:.1f}s")
+            return real_time, speed_indicators
+        
+        try:
+            print("🎯 Testing Demo Mode and Real Blockchain Mode speed side by side...")
+            
+            # Both sessions are timed from their own start, so run them in parallel
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                demo_future = executor.submit(run_demo_mode)
+                real_future = executor.submit(run_real_mode)
+                demo_time = demo_future.result()
+                real_outcome = real_future.result()
+            
+            if demo_time is None or real_outcome is None:
+                return False
+            real_time, speed_indicators = real_outcome
             
             # Analyze speed comparison
             success_indicators = 0
@@ -529,25 +688,157 @@ class SuperOptimizedTester:
             print(f"❌ Speed comparison test FAILED - Error: {e}")
             return False
     
+    def test_batch_word_validation(self):
+        """Test 5: BIP39 Word Validation - new coverage for /validate-words (the suite had no word checks before)"""
+        print("\n📝 Testing Batch BIP39 Word Validation...")
+        
+        test_cases = WORD_VALIDATION_CASES
+        
+        try:
+            # Every case goes through the server (including its case handling for "ABOUT")
+            response = self.session.post(
+                f"{self.base_url}/validate-words",
+                json={"words": WORD_VALIDATION_WORDS},
+                timeout=10
+            )
+            
+            if response.status_code in (404, 405):
+                # Older backend without the batch endpoint - validate every word concurrently
+                print("ℹ️ /validate-words not available, validating words in parallel")
+                results = [None] * len(test_cases)
+                get = self.session.get
+                validate_word_url = self.base_url + "/validate-word/"
+                with ThreadPoolExecutor(max_workers=len(test_cases)) as executor:
+                    futures = {
+                        executor.submit(get, validate_word_url + word, timeout=10): index
+                        for index, (word, _) in enumerate(test_cases)
+                    }
+                    for future in as_completed(futures):
+                        index = futures[future]
+                        word_response = future.result()
+                        if word_response.status_code == 200:
+                            results[index] = word_response.json()
+                        if FAIL_FAST and (results[index] or {}).get("valid") != test_cases[index][1]:
+                            # Conclusive failure - drop the requests that haven't been sent yet
+                            for pending in futures:
+                                pending.cancel()
+                            print(f"❌ '{test_cases[index][0]}' -> {results[index]} (expected valid={test_cases[index][1]})")
+                            return False
+                results = [result or {} for result in results]
+            elif response.status_code != 200:
+                print(f"❌ Batch word validation FAILED - Status: {response.status_code}")
+                return False
+            else:
+                results = response.json().get("results", [])
+            
+            if len(results) != len(test_cases):
+                print(f"❌ Batch word validation FAILED - Expected {len(test_cases)} results, got {len(results)}")
+                return False
+            
+            # The full wordlist (fetched once per process) is only a cross-check of the server's answers
+            bip39_words = self.get_bip39_words()
+            
+            all_correct = True
+            for (word, expected), result in zip(test_cases, results):
+                valid = result.get("valid")
+                if valid != expected:
+                    print(f"❌ '{word}' -> valid={valid} (expected {expected})")
+                    all_correct = False
+                elif bip39_words is not None and (word.lower() in bip39_words) != valid:
+                    print(f"❌ '{word}' -> valid={valid} but the served wordlist disagrees")
+                    all_correct = False
+                else:
+                    print(f"✅ '{word}' -> valid={valid}")
+                    continue
+                if FAIL_FAST:
+                    return False
+            
+            if all_correct:
+                print(f"✅ Batch Word Validation PASSED - {len(test_cases)} words validated")
+            return all_correct
+            
+        except Exception as e:
+            print(f"❌ Batch word validation FAILED - Error: {e}")
+            return False
+    
+    def test_cancel_session(self):
+        """Test 6: Cancellation - start a session, cancel it, and /wait and the SSE stream report it cancelled"""
+        print("\n🛑 Testing Session Cancellation...")
+        
+        try:
+            response = self.session.post(self.start_recovery_url, json=CANCEL_TEST_SESSION, timeout=15)
+            if response.status_code != 200:
+                print(f"❌ Could not start session: {response.status_code}")
+                return False
+            session_id = response.json()["session_id"]
+            self.session_ids.append(session_id)
+            
+            cancel_response = self.session.post(f"{self.base_url}/cancel/{session_id}", timeout=10)
+            if cancel_response.status_code != 200:
+                print(f"❌ Cancel FAILED - Status: {cancel_response.status_code}")
+                return False
+            print(f"✅ Cancel requested: {cancel_response.json().get('status')}")
+            
+            # Long-poll until the session finishes - it must end as cancelled, not run to completion
+            wait_response = self.session.get(
+                f"{self.base_url}/session/{session_id}/wait",
+                params={"timeout": 10},
+                timeout=15
+            )
+            if wait_response.status_code != 200:
+                print(f"❌ /wait FAILED - Status: {wait_response.status_code}")
+                return False
+            session_data = wait_response.json()
+            status = session_data.get("status")
+            if status != "cancelled":
+                print(f"❌ /wait returned status '{status}' (expected 'cancelled')")
+                return False
+            print(f"✅ /wait returned 'cancelled' after {session_data.get('combinations_checked', 0)} combinations")
+            
+            # The status stream of a finished session sends its final state and closes
+            last_event = None
+            with self.session.get(
+                f"{self.base_url}/session/{session_id}/stream",
+                stream=True,
+                timeout=(5, SSE_KEEPALIVE_SECONDS + 5)
+            ) as stream_response:
+                stream_response.raise_for_status()
+                for line in stream_response.iter_lines(chunk_size=None, decode_unicode=True):
+                    if line.startswith("data: "):
+                        last_event = json.loads(line[6:])
+            stream_status = (last_event or {}).get("status")
+            if stream_status != "cancelled":
+                print(f"❌ Session stream ended with status '{stream_status}' (expected 'cancelled')")
+                return False
+            print("✅ Session stream ended with 'cancelled'")
+            
+            print("✅ Session Cancellation PASSED")
+            return True
+            
+        except Exception as e:
+            print(f"❌ Session cancellation FAILED - Error: {e}")
+            return False
+    
     def run_super_optimized_tests(self):
         """Run all SUPER OPTIMIZED tests"""
         print("🚀 SUPER OPTIMIZED Bitcoin Recovery Backend Test Suite")
         print("🎯 Focus: Threading, Concurrent Balance Checking, Optimized Timeouts, Cache Performance")
         print("=" * 90)
         
-        results = {}
-        
-        # Test 1: Threading-Based Concurrent Balance Checking
-        results["threading_concurrent_balance"] = self.test_threading_concurrent_balance_checking()
-        
-        # Test 2: Optimized Timeouts and Delays
-        results["optimized_timeouts_delays"] = self.test_optimized_timeouts_and_delays()
-        
-        # Test 3: Cache Performance
-        results["cache_performance"] = self.test_cache_performance()
+        # Each test drives its own backend sessions, so run them side by side -
+        # total runtime is the slowest test instead of the sum of all of them
+        tests = {
+            "threading_concurrent_balance": self.test_threading_concurrent_balance_checking,  # Test 1
+            "optimized_timeouts_delays": self.test_optimized_timeouts_and_delays,  # Test 2
+            "cache_performance": self.test_cache_performance,  # Test 3
+            "speed_comparison": self.test_speed_comparison_demo_vs_real,  # Test 4
+            "batch_word_validation": self.test_batch_word_validation,  # Test 5
+            "cancel_session": self.test_cancel_session,  # Test 6
+        }
         
-        # Test 4: Speed Comparison
-        results["speed_comparison"] = self.test_speed_comparison_demo_vs_real()
+        with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+            futures = {name: executor.submit(test) for name, test in tests.items()}
+            results = {name: future.result() for name, future in futures.items()}
         
         # Summary
         print("\n" + "=" * 90)
@@ -592,5 +883,6 @@ class SuperOptimizedTester:
         return results
 
 if __name__ == "__main__":
-    tester = SuperOptimizedTester()
-    test_results = tester.run_super_optimized_tests()
\ No newline at end of file
+    # Test sessions are deleted and pooled connections closed when the run ends, even on failure
+    with SuperOptimizedTester() as tester:
+        test_results = tester.run_super_optimized_tests()
\ No newline at end of file